@@ -57,9 +57,9 @@ code. To launch the editor and make changes to the "snake" game run::
   $ python3 -m idlelib.idle snake.py
 """
 
-from .utils import floor, line, path, square, vector
+from .utils import SpatialHash, floor, line, path, square, vector
 
-__all__ = ['floor', 'line', 'path', 'square', 'vector']
+__all__ = ['SpatialHash', 'floor', 'line', 'path', 'square', 'vector']
 
 __title__ = 'freegames'
 __version__ = '2.4.0'
@@ -6,73 +6,73 @@ Exercises
 2. Vary the effect of gravity.
 3. Apply gravity to the targets.
 4. Change the speed of the ball.
+5. Limit how many balls can fly at once.
+6. Press "a" to aim automatically. How is the aim computed?
 """
 
 from random import randrange
 from turtle import *
 
-from freegames import vector
+from freegames.engines.cannon import Field, aim
 
-ball = vector(-200, -200)
-speed = vector(0, 0)
-targets = []
+field = Field()
+state = {'auto': False}
 
 
 def tap(x, y):
-    """Respond to screen tap."""
-    if not inside(ball):
-        ball.x = -199
-        ball.y = -199
-        speed.x = (x + 200) / 25
-        speed.y = (y + 200) / 25
+    """Respond to screen tap by firing a ball."""
+    field.fire(-199, -199, (x + 200) / 25, (y + 200) / 25)
 
 
-def inside(xy):
-    """Return True if xy within screen."""
-    return -200 < xy.x < 200 and -200 < xy.y < 200
+def shoot(x, y):
+    """Tap where the ball will hit the target at (x, y), if it can be hit."""
+    speed = aim(x, y)
+
+    if speed is not None:
+        dx, dy = speed
+        tap(dx * 25 - 200, dy * 25 - 200)
+
+
+def auto():
+    """Toggle automatic aiming and shoot at every target on screen."""
+    state['auto'] = not state['auto']
+
+    if state['auto']:
+        targets = field.targets
+        for x, y in zip(targets.xs, targets.ys):
+            shoot(x, y)
 
 
 def draw():
-    """Draw ball and targets."""
+    """Draw balls and targets."""
     clear()
+    targets = field.targets
+    balls = field.balls
 
-    for target in targets:
-        goto(target.x, target.y)
+    for x, y in zip(targets.xs, targets.ys):
+        goto(x, y)
         dot(20, 'blue')
 
-    if inside(ball):
-        goto(ball.x, ball.y)
+    for x, y in zip(balls.xs, balls.ys):
+        goto(x, y)
         dot(6, 'red')
 
     update()
 
 
 def move():
-    """Move ball and targets."""
+    """Move balls and targets."""
     if randrange(40) == 0:
         y = randrange(-150, 150)
-        target = vector(200, y)
-        targets.append(target)
-
-    for target in targets:
-        target.x -= 0.5
-
-    if inside(ball):
-        speed.y -= 0.35
-        ball.move(speed)
-
-    dupe = targets.copy()
-    targets.clear()
-
-    for target in dupe:
-        if abs(target - ball) > 13:
-            targets.append(target)
+        field.spawn(y)
+        if state['auto']:
+            shoot(200, y)
 
+    field.step()
     draw()
 
-    for target in targets:
-        if not inside(target):
-            return
+    if field.escaped():
+        return
 
     ontimer(move, 50)
 
@@ -82,5 +82,7 @@ hideturtle()
 up()
 tracer(False)
 onscreenclick(tap)
+listen()
+onkey(auto, 'a')
 move()
 done()
@@ -5,16 +5,19 @@ Exercises
 1. Change the colors.
 2. Draw squares instead of circles for open spaces.
 3. Add logic to detect a full row.
-4. Create a random computer player.
-5. How would you detect a winner?
+4. Change the computer's thinking time.
+5. How does the board detect a winner?
+6. Build an opening book with "python3 -m freegames.engines.connect".
 """
 
 from turtle import *
 
 from freegames import line
+from freegames.engines.connect import Board, Book, Player, location
 
-turns = {'red': 'yellow', 'yellow': 'red'}
-state = {'player': 'yellow', 'rows': [0] * 8}
+colors = ['yellow', 'red']
+board = Board(8, 8)
+computer = Player(budget=0.2, book=Book(location(8, 8), 8, 8))
 
 
 def grid():
@@ -33,24 +36,32 @@ def grid():
     update()
 
 
-def tap(x, y):
-    """Draw red or yellow circle in tapped row."""
-    player = state['player']
-    rows = state['rows']
-
-    row = int((x + 200) // 50)
-    count = rows[row]
-
-    x = ((x + 200) // 50) * 50 - 200 + 25
-    y = count * 50 - 200 + 25
+def drop(column):
+    """Drop piece in `column` and return True if the game is over."""
+    player = colors[board.player]
+    row = board.play(column)
 
     up()
-    goto(x, y)
+    goto(column * 50 - 175, row * 50 - 175)
     dot(40, player)
     update()
 
-    rows[row] = count + 1
-    state['player'] = turns[player]
+    if board.won():
+        print(player.title(), 'wins!')
+        return True
+
+    return board.full()
+
+
+def tap(x, y):
+    """Drop yellow piece in tapped column and let the computer reply."""
+    column = int((x + 200) // 50)
+
+    if board.won() or not board.playable(column):
+        return
+
+    if not drop(column):
+        drop(computer.move(board))
 
 
 setup(420, 420, 370, 0)
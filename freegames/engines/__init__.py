@@ -0,0 +1,25 @@
+"""Free Python Games Engines
+
+Engines are headless versions of game rules. They never import turtle so they
+can run without a screen: in tests, in bots, and in worker processes that play
+many games at once. Games import the engine they need like any other helper::
+
+  from freegames.engines.tron import inside
+"""
+
+import os
+
+
+def cache(filename):
+    """Return full path to `filename` in the engines cache directory.
+
+    Engines save tables that are slow to build, like puzzle pattern databases,
+    so later runs can load them at once. The directory is
+    "~/.cache/freegames" unless the FREEGAMES_CACHE environment variable names
+    another directory. It is created when missing.
+
+    """
+    default = os.path.join('~', '.cache', 'freegames')
+    directory = os.path.expanduser(os.environ.get('FREEGAMES_CACHE', default))
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, filename)
@@ -0,0 +1,64 @@
+"""Atlas engine, slice GIF images into tiles with Tk.
+
+Turtle can only show GIF images as shapes, so tiles of a picture are saved as
+small GIF files. Tk, which turtle draws with, loads the picture and writes
+each tile from its own part of the image. Tk needs a window first, so slice
+images after turtle `setup()`.
+
+Slicing a big image takes a while so the tiles are saved in the engines cache
+directory, in a folder named by a hash of the image and the grid size. Later
+runs find the folder and load the tiles at once.
+"""
+
+import hashlib
+import os
+import struct
+from tkinter import PhotoImage
+
+from freegames.engines import cache
+
+
+def dimensions(filename):
+    """Return (width, height) of GIF image in `filename`."""
+    with open(filename, 'rb') as reader:
+        header = reader.read(10)
+
+    return struct.unpack('<HH', header[6:])
+
+
+def slices(filename, columns, rows):
+    """Return list of GIF filenames for `columns` by `rows` tiles of image.
+
+    Tiles are listed row by row from the bottom left, like the cells of a
+    game grid. They are cached by a hash of the image and the grid size.
+
+    """
+    with open(filename, 'rb') as reader:
+        data = reader.read()
+
+    digest = hashlib.sha256(data).hexdigest()[:16]
+    name = 'atlas-{}-{}x{}'.format(digest, columns, rows)
+    folder = cache(name)
+    names = [
+        os.path.join(folder, '{}.gif'.format(count))
+        for count in range(columns * rows)
+    ]
+
+    if os.path.isdir(folder):
+        return names
+
+    image = PhotoImage(file=filename)
+    wide = image.width() // columns
+    tall = image.height() // rows
+    temporary = folder + '.tmp'
+    os.makedirs(temporary, exist_ok=True)
+
+    for count, name in enumerate(names):
+        left = count % columns * wide
+        top = (rows - 1 - count // columns) * tall
+        corners = left, top, left + wide, top + tall
+        path = os.path.join(temporary, os.path.basename(name))
+        image.write(path, format='gif', from_coords=corners)
+
+    os.replace(temporary, folder)
+    return names
@@ -0,0 +1,66 @@
+"""Bodies engine, positions and velocities stored in parallel arrays.
+
+Games with many moving things, like cannon balls or pong balls, keep each
+coordinate in an array of floats. Moving every body is a few bulk `map`
+passes over the arrays and removing bodies compacts the arrays in place, so
+no vectors are created and no lists are copied per tick.
+"""
+
+from array import array
+from itertools import repeat
+from operator import add, sub
+
+
+class Bodies:
+    """Bodies with positions and velocities in parallel arrays.
+
+    >>> bodies = Bodies()
+    >>> bodies.add(0, 0, 1, 2)
+    >>> bodies.add(5, 5, 0, 0)
+    >>> bodies.move(gravity=1)
+    >>> list(bodies.xs), list(bodies.ys)
+    ([1.0, 5.0], [1.0, 4.0])
+    >>> bodies.keep([False, True])
+    >>> list(bodies.xs)
+    [5.0]
+
+    """
+
+    def __init__(self):
+        self.xs = array('d')
+        self.ys = array('d')
+        self.dxs = array('d')
+        self.dys = array('d')
+
+    def __len__(self):
+        return len(self.xs)
+
+    def add(self, x, y, dx, dy):
+        """Add body at (x, y) moving (dx, dy) per tick."""
+        self.xs.append(x)
+        self.ys.append(y)
+        self.dxs.append(dx)
+        self.dys.append(dy)
+
+    def move(self, gravity=0):
+        """Pull bodies down by `gravity` and move them one tick."""
+        if gravity:
+            self.dys[:] = array('d', map(sub, self.dys, repeat(gravity)))
+
+        self.xs[:] = array('d', map(add, self.xs, self.dxs))
+        self.ys[:] = array('d', map(add, self.ys, self.dys))
+
+    def keep(self, flags):
+        """Remove bodies whose flag is false, moving the rest down in place."""
+        columns = self.xs, self.ys, self.dxs, self.dys
+        count = 0
+
+        for index, flag in enumerate(flags):
+            if flag:
+                if count != index:
+                    for values in columns:
+                        values[count] = values[index]
+                count += 1
+
+        for values in columns:
+            del values[count:]
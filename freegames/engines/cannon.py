@@ -0,0 +1,168 @@
+"""Cannon engine, targets and balls stored in arrays.
+
+Targets and balls are `Bodies`, with positions and velocities in parallel
+arrays of floats, so no vectors are created and no lists are copied per tick.
+
+Balls hit targets within `RADIUS`. Balls are put in a spatial hash once
+per tick and each target only checks the balls in the cells around it.
+
+Aiming needs no trial shots. Each tick a ball's speed drops by `GRAVITY` and
+then the ball moves, so after `n` ticks a ball fired from `START` with speed
+(dx, dy) is at::
+
+  x = START + n * dx
+  y = START + n * dy - GRAVITY * n * (n + 1) / 2
+
+and a target has drifted `n * SPEED` to the left. Solving for (dx, dy) hits
+the target exactly after `n` ticks. Speeds must be ones a tap can make, from
+0 to `FASTEST`, which bounds `n` by a linear and a quadratic inequality.
+"""
+
+import math
+from functools import lru_cache
+
+from freegames.engines.bodies import Bodies
+from freegames.utils import SpatialHash
+
+RADIUS = 13
+GRAVITY = 0.35
+SPEED = 0.5
+START = -199
+FASTEST = 16
+
+
+def inside(x, y):
+    """Return True if (x, y) within screen.
+
+    >>> inside(0, 199), inside(-200, 0)
+    (True, False)
+
+    """
+    return -200 < x < 200 and -200 < y < 200
+
+
+def speed(x, y, ticks):
+    """Return ball speed (dx, dy) from `START` that hits target now at (x, y)
+    after `ticks` ticks.
+
+    >>> speed(1, 1, 1)
+    (199.5, 200.35)
+
+    """
+    dx = (x - SPEED * ticks - START) / ticks
+    dy = (y - START) / ticks + GRAVITY * (ticks + 1) / 2
+    return dx, dy
+
+
+@lru_cache(maxsize=4096)
+def window(x, y):
+    """Return range of tick counts after which a ball can hit target now at
+    (x, y) with speeds from 0 to `FASTEST`.
+
+    Targets drift along a fixed grid of positions so results are cached.
+
+    >>> window(200, 0)
+    range(25, 76)
+    >>> window(-195, 150)
+    range(0, 0)
+
+    """
+    distance = x - START
+    height = y - START
+    low = math.ceil(distance / (FASTEST + SPEED))
+    high = math.floor(distance / SPEED)
+    a = GRAVITY / 2
+    b = GRAVITY / 2 - FASTEST
+    discriminant = b * b - 4 * a * height
+
+    if discriminant < 0:
+        return range(0)
+
+    root = math.sqrt(discriminant)
+    low = max(low, math.ceil((-b - root) / (2 * a)), 1)
+    high = min(high, math.floor((-b + root) / (2 * a)))
+
+    if low > high:
+        return range(0)
+
+    return range(low, high + 1)
+
+
+def aim(x, y):
+    """Return speed (dx, dy) that hits target now at (x, y) soonest or None.
+
+    >>> dx, dy = aim(200, 0)
+    >>> round(dx, 2), round(dy, 2)
+    (15.46, 12.51)
+
+    """
+    ticks = window(x, y)
+
+    if not ticks:
+        return None
+
+    return speed(x, y, ticks[0])
+
+
+class Field:
+    """Targets flying left and balls fired at them.
+
+    >>> field = Field()
+    >>> field.spawn(0)
+    >>> field.fire(190, 0, 0, 0)
+    >>> field.step()
+    1
+    >>> len(field.targets)
+    0
+
+    """
+
+    def __init__(self):
+        self.targets = Bodies()
+        self.balls = Bodies()
+
+    def spawn(self, y):
+        """Add target at the right edge of the screen at height `y`."""
+        self.targets.add(200, y, -SPEED, 0)
+
+    def fire(self, x, y, dx, dy):
+        """Add ball at (x, y) moving (dx, dy) per tick."""
+        self.balls.add(x, y, dx, dy)
+
+    def step(self):
+        """Move targets and balls one tick and return number of targets hit.
+
+        Balls that leave the screen are removed. Balls keep flying after
+        hitting a target.
+
+        """
+        targets = self.targets
+        balls = self.balls
+        targets.move()
+        balls.move(GRAVITY)
+        balls.keep(list(map(inside, balls.xs, balls.ys)))
+
+        if not balls:
+            return 0
+
+        flags = self.missed()
+        targets.keep(flags)
+        return len(flags) - sum(flags)
+
+    def missed(self):
+        """Return list of flags, True for each target no ball is touching."""
+        balls = self.balls
+        grid = SpatialHash(RADIUS * 2)
+
+        for index, (x, y) in enumerate(zip(balls.xs, balls.ys)):
+            grid.insert(index, x, y)
+
+        return [
+            not grid.query(x, y, RADIUS, closed=True)
+            for x, y in zip(self.targets.xs, self.targets.ys)
+        ]
+
+    def escaped(self):
+        """Return True if any target has left the screen."""
+        targets = self.targets
+        return not all(map(inside, targets.xs, targets.ys))
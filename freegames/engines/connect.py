@@ -0,0 +1,615 @@
+"""Connect Four engine, boards stored in bitboards.
+
+Each player's pieces are one integer with a bit per cell. Cells are numbered
+column by column from the bottom left and every column has one extra bit on
+top that is never set, so the cell at `column` and `row` is bit
+`column * (rows + 1) + row`. The spare bit keeps lines from wrapping from the
+top of one column to the bottom of the next.
+
+Four in a row is found with shifts: `bits & (bits >> shift)` marks pieces
+with a neighbor `shift` bits away, and doing that again with twice the shift
+marks four in a row. Shifts of 1, `rows + 1`, `rows` and `rows + 2` check
+vertical, horizontal and both diagonal lines. The standard 7x6 board fits in
+64 bits and larger boards simply use larger integers.
+
+The computer player searches with alpha-beta negamax and iterative deepening
+until its time budget runs out. Moves are tried from the center out, best
+moves found earlier are tried first, and results are kept in a fixed-size
+transposition table.
+
+Offline analysis splits the root moves of a search across worker processes
+and saves the best move of every early position in an opening book. Build the
+book for the connect game from the command-line::
+
+  $ python3 -m freegames.engines.connect --plies 4 --depth 10
+
+The book is a file of fixed-size records sorted by position key. Players
+memory-map it and find positions with a binary search, so early replies are
+instant and the file is never read into memory.
+"""
+
+import argparse
+import mmap
+import multiprocessing
+import os
+import time
+
+from freegames.engines import cache
+
+WIN = 1000
+EXACT, LOWER, UPPER = 0, 1, 2
+shared = {}
+
+
+def four(bits, stride):
+    """Return True if `bits` has four in a row on a board with columns of
+    `stride` bits.
+
+    >>> four(0b1111, 7)
+    True
+    >>> four(0b0111 | 1 << 7, 7)
+    False
+
+    """
+    for shift in (1, stride, stride - 1, stride + 1):
+        pairs = bits & (bits >> shift)
+        if pairs & (pairs >> (2 * shift)):
+            return True
+
+    return False
+
+
+def threats(bits, mask, cells, stride):
+    """Return bitboard of empty cells that would give `bits` four in a row.
+
+    `mask` has every piece set and `cells` has every cell set.
+
+    >>> bin(threats(0b111, 0b111, 0b111111, 7))
+    '0b1000'
+
+    """
+    spots = (bits << 1) & (bits << 2) & (bits << 3)
+
+    for shift in (stride, stride - 1, stride + 1):
+        pairs = (bits << shift) & (bits << (2 * shift))
+        spots |= pairs & (bits << (3 * shift))
+        spots |= pairs & (bits >> shift)
+        pairs = (bits >> shift) & (bits >> (2 * shift))
+        spots |= pairs & (bits << shift)
+        spots |= pairs & (bits >> (3 * shift))
+
+    return spots & cells & ~mask
+
+
+def count(bits):
+    """Return number of bits set.
+
+    >>> count(0b1011)
+    3
+
+    """
+    return bin(bits).count('1')
+
+
+class Board:
+    """Connect Four board with `columns` by `rows` cells.
+
+    Players take turns starting with player 0. `players` holds one bitboard
+    per player and `heights` holds the number of pieces in each column.
+
+    >>> board = Board(4, 4)
+    >>> for column in [0, 1, 0, 1, 0, 1]:
+    ...     row = board.play(column)
+    >>> board.won()
+    False
+    >>> board.play(0)
+    3
+    >>> board.won()
+    True
+
+    """
+
+    def __init__(self, columns=7, rows=6):
+        self.columns = columns
+        self.rows = rows
+        self.stride = rows + 1
+        self.players = [0, 0]
+        self.heights = [0] * columns
+        self.moves = []
+        self.bottom = sum(self.bit(column, 0) for column in range(columns))
+        self.cells = self.bottom * ((1 << rows) - 1)
+
+    @property
+    def player(self):
+        """Player to move next, 0 or 1."""
+        return len(self.moves) % 2
+
+    def bit(self, column, row):
+        """Return bitboard with only the cell at `column` and `row` set."""
+        return 1 << (column * self.stride + row)
+
+    def playable(self, column):
+        """Return True if a piece can be dropped in `column`."""
+        return 0 <= column < self.columns and self.heights[column] < self.rows
+
+    def play(self, column):
+        """Drop a piece for the player to move in `column` and return its
+        row.
+
+        """
+        row = self.heights[column]
+        self.players[self.player] |= self.bit(column, row)
+        self.heights[column] = row + 1
+        self.moves.append(column)
+        return row
+
+    def undo(self):
+        """Take back the last move."""
+        column = self.moves.pop()
+        row = self.heights[column] - 1
+        self.heights[column] = row
+        self.players[self.player] ^= self.bit(column, row)
+
+    def won(self):
+        """Return True if the last move made four in a row."""
+        return four(self.players[1 - self.player], self.stride)
+
+    def full(self):
+        """Return True if every cell has a piece."""
+        return len(self.moves) == self.columns * self.rows
+
+    def width(self):
+        """Return number of bytes needed to store a position key."""
+        return (self.columns * self.stride + 7) // 8
+
+    def winning(self):
+        """Return column that wins at once for the player to move or None."""
+        current = self.players[self.player]
+        mask = self.players[0] | self.players[1]
+        wins = threats(current, mask, self.cells, self.stride)
+
+        for column in range(self.columns):
+            if self.playable(column) and wins & self.bit(
+                column, self.heights[column]
+            ):
+                return column
+
+        return None
+
+    def key(self):
+        """Return integer that identifies the position.
+
+        The pieces of the player to move plus all pieces sets one bit above
+        each column's pieces, so no two positions share a key.
+
+        """
+        mask = self.players[0] | self.players[1]
+        return self.players[self.player] + mask
+
+
+class Timeout(Exception):
+    """Raised when a search runs out of time."""
+
+
+class Table:
+    """Transposition table with `size` slots.
+
+    Each slot holds one entry `(key, depth, flag, value, column, age)`. A new
+    entry replaces an older one only if it was searched at least as deep or
+    the older one is left over from an earlier search, so deep results stay
+    in the table while it fills up.
+
+    >>> table = Table(4)
+    >>> table.store(5, 3, EXACT, 10, 2)
+    >>> table.store(9, 1, EXACT, 20, 0)
+    >>> table.get(5)
+    (5, 3, 0, 10, 2, 0)
+    >>> table.get(9)
+
+    """
+
+    def __init__(self, size=1 << 16):
+        self.size = size
+        self.slots = [None] * size
+        self.age = 0
+
+    def get(self, key):
+        """Return entry for `key` or None."""
+        entry = self.slots[key % self.size]
+        if entry is not None and entry[0] == key:
+            return entry
+        return None
+
+    def store(self, key, depth, flag, value, column):
+        """Store search result for `key` unless a deeper one is kept."""
+        slot = key % self.size
+        entry = self.slots[slot]
+
+        if entry is None or entry[5] != self.age or entry[1] <= depth:
+            self.slots[slot] = (key, depth, flag, value, column, self.age)
+
+
+class Player:
+    """Computer player that searches for `budget` seconds per move.
+
+    When `depth` is given the search stops at that depth even if time is
+    left. When `book` is given, positions found in the book are answered
+    without searching. Scores count from the view of the player to move:
+    winning with more empty cells left scores higher, and positions at the
+    search horizon score the difference in threats, empty cells that would
+    finish a line.
+
+    >>> board = Board()
+    >>> for column in [0, 6, 1, 6, 2]:
+    ...     row = board.play(column)
+    >>> Player(depth=4).move(board)
+    3
+
+    """
+
+    def __init__(self, budget=0.2, depth=None, size=1 << 16, book=None):
+        self.budget = budget
+        self.depth = depth
+        self.table = Table(size)
+        self.book = book
+        self.deadline = float('inf')
+        self.nodes = 0
+
+    def order(self, board):
+        """Return columns sorted from the center out."""
+        middle = board.columns - 1
+        return sorted(range(board.columns), key=lambda x: abs(2 * x - middle))
+
+    def move(self, board):
+        """Return best column found for the player to move."""
+        if self.book is not None:
+            column = self.book.get(board)
+            if column is not None:
+                return column
+
+        column = board.winning()
+
+        if column is not None:
+            return column
+
+        self.deadline = time.perf_counter() + self.budget
+        self.table.age += 1
+        self.nodes = 0
+        columns = [x for x in self.order(board) if board.playable(x)]
+        choice = columns[0]
+        empty = board.columns * board.rows - len(board.moves)
+        limit = min(empty, self.depth or empty)
+
+        for depth in range(1, limit + 1):
+            try:
+                value, choice = self.root(board, columns, choice, depth)
+            except Timeout:
+                break
+
+            if abs(value) > WIN:
+                break
+
+        return choice
+
+    def root(self, board, columns, choice, depth):
+        """Return (value, column) of the best move searched to `depth`.
+
+        The previous `choice` is searched first.
+
+        """
+        alpha = -WIN * 2
+        best = choice
+
+        for column in [choice] + [x for x in columns if x != choice]:
+            board.play(column)
+            try:
+                value = -self.negamax(board, depth - 1, -WIN * 2, -alpha)
+            finally:
+                board.undo()
+
+            if value > alpha:
+                alpha = value
+                best = column
+
+        return alpha, best
+
+    def negamax(self, board, depth, alpha, beta):
+        """Return value of `board` searched to `depth` in window alpha-beta."""
+        self.nodes += 1
+
+        if time.perf_counter() > self.deadline:
+            raise Timeout
+
+        stride = board.stride
+        cells = board.cells
+        current = board.players[board.player]
+        other = board.players[1 - board.player]
+        mask = current | other
+        possible = (mask + board.bottom) & cells
+        empty = board.columns * board.rows - len(board.moves)
+
+        if threats(current, mask, cells, stride) & possible:
+            return WIN + empty
+
+        if not possible:
+            return 0
+
+        if depth == 0:
+            mine = count(threats(current, mask, cells, stride))
+            theirs = count(threats(other, mask, cells, stride))
+            return mine - theirs
+
+        start = alpha
+        key = current + mask
+        entry = self.table.get(key)
+        choice = None
+
+        if entry is not None:
+            choice = entry[4]
+            if entry[1] >= depth:
+                flag, value = entry[2], entry[3]
+                if flag == EXACT:
+                    return value
+                if flag == LOWER:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value
+
+        forced = threats(other, mask, cells, stride) & possible
+        columns = []
+
+        for column in self.order(board):
+            spot = board.bit(column, board.heights[column])
+            if spot & possible and (not forced or spot & forced):
+                columns.append(column)
+
+        if count(forced) > 1:
+            return -(WIN + empty - 1)
+
+        if choice in columns:
+            columns.remove(choice)
+            columns.insert(0, choice)
+
+        best = -WIN * 2
+
+        for column in columns:
+            board.play(column)
+            try:
+                value = -self.negamax(board, depth - 1, -beta, -alpha)
+            finally:
+                board.undo()
+
+            if value > best:
+                best = value
+                choice = column
+
+            if value > alpha:
+                alpha = value
+
+            if alpha >= beta:
+                break
+
+        if best <= start:
+            flag = UPPER
+        elif best >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+
+        self.table.store(key, depth, flag, best, choice)
+        return best
+
+
+def share(bound):
+    """Keep shared `bound` for root searches in this process."""
+    shared['bound'] = bound
+
+
+def split(task):
+    """Return (value, column) of one root move searched to `depth`.
+
+    The task is `(columns, rows, moves, column, depth)`. The search window
+    starts just below the best value any process has found so far, read from
+    the shared bound, and better values are written back to it.
+
+    """
+    columns, rows, moves, column, depth = task
+    board = Board(columns, rows)
+
+    for move in moves:
+        board.play(move)
+
+    board.play(column)
+    bound = shared['bound']
+    alpha = bound.value
+    value = -Player().negamax(board, depth - 1, -WIN * 2, -(alpha - 1))
+
+    with bound.get_lock():
+        if value > bound.value:
+            bound.value = value
+
+    return value, column
+
+
+class Analyst:
+    """Search positions with root moves split across `workers` processes.
+
+    Each process searches whole root moves with its own transposition table.
+    Processes share the best value found so far through a shared integer so
+    later root moves are searched with a narrower window.
+
+    """
+
+    def __init__(self, workers=None):
+        self.bound = multiprocessing.Value('i', 0)
+        workers = workers or os.cpu_count()
+
+        if workers == 1:
+            self.pool = None
+            share(self.bound)
+        else:
+            self.pool = multiprocessing.Pool(workers, share, (self.bound,))
+
+    def close(self):
+        """Stop worker processes."""
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+
+    def analyze(self, board, depth):
+        """Return (value, column) of best move for the player to move."""
+        column = board.winning()
+
+        if column is not None:
+            empty = board.columns * board.rows - len(board.moves)
+            return WIN + empty, column
+
+        order = [x for x in Player().order(board) if board.playable(x)]
+        tasks = [
+            (board.columns, board.rows, board.moves, column, depth)
+            for column in order
+        ]
+        self.bound.value = -WIN * 2
+
+        if self.pool is None:
+            results = list(map(split, tasks))
+        else:
+            results = self.pool.map(split, tasks, 1)
+
+        return max(results, key=lambda result: result[0])
+
+
+def openings(columns, rows, plies):
+    """Return move lists reaching each position with fewer than `plies`
+    moves where the player to move can still play.
+
+    >>> openings(2, 2, 2)
+    [[], [0], [1]]
+
+    """
+    board = Board(columns, rows)
+    found = {}
+
+    def visit():
+        key = board.key()
+
+        if key in found or board.won() or board.full():
+            return
+
+        found[key] = list(board.moves)
+
+        if len(board.moves) + 1 < plies:
+            for column in range(columns):
+                if board.playable(column):
+                    board.play(column)
+                    visit()
+                    board.undo()
+
+    visit()
+    return list(found.values())
+
+
+def write(filename, columns=8, rows=8, plies=4, depth=10, workers=None):
+    """Write opening book of best moves for positions before `plies` moves,
+    searched to `depth`, and return number of positions.
+
+    """
+    analyst = Analyst(workers)
+    records = []
+
+    try:
+        for moves in openings(columns, rows, plies):
+            board = Board(columns, rows)
+            for move in moves:
+                board.play(move)
+            value, column = analyst.analyze(board, depth)
+            records.append((board.key(), column))
+    finally:
+        analyst.close()
+
+    width = Board(columns, rows).width()
+    records.sort()
+    temporary = filename + '.tmp'
+
+    with open(temporary, 'wb') as writer:
+        for key, column in records:
+            writer.write(key.to_bytes(width, 'big') + bytes([column]))
+
+    os.replace(temporary, filename)
+    return len(records)
+
+
+def location(columns=8, rows=8):
+    """Return default opening book filename for `columns` by `rows` boards."""
+    return cache('connect-{}x{}.book'.format(columns, rows))
+
+
+class Book:
+    """Opening book in `filename` for `columns` by `rows` boards.
+
+    Records are a big-endian position key followed by one byte for the best
+    column. A missing book answers nothing.
+
+    """
+
+    def __init__(self, filename, columns=8, rows=8):
+        self.width = Board(columns, rows).width()
+        self.size = self.width + 1
+        self.records = b''
+
+        if os.path.exists(filename) and os.path.getsize(filename):
+            with open(filename, 'rb') as reader:
+                self.records = mmap.mmap(
+                    reader.fileno(), 0, access=mmap.ACCESS_READ
+                )
+
+    def __len__(self):
+        return len(self.records) // self.size
+
+    def get(self, board):
+        """Return best column for `board` or None if not in the book."""
+        target = board.key().to_bytes(self.width, 'big')
+        records = self.records
+        low = 0
+        high = len(self)
+
+        while low < high:
+            middle = (low + high) // 2
+            start = middle * self.size
+            stop = start + self.width
+
+            if records[start:stop] < target:
+                low = middle + 1
+            else:
+                high = middle
+
+        start = low * self.size
+        stop = start + self.width
+
+        if records[start:stop] == target:
+            return records[stop]
+
+        return None
+
+
+def main(args=None):
+    """Write opening book from command-line arguments."""
+    parser = argparse.ArgumentParser(description='Connect Four opening book')
+    parser.add_argument('filename', nargs='?', help='book file')
+    parser.add_argument('--columns', type=int, default=8)
+    parser.add_argument('--rows', type=int, default=8)
+    parser.add_argument('--plies', type=int, default=4)
+    parser.add_argument('--depth', type=int, default=10)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args(args)
+    name = args.filename or location(args.columns, args.rows)
+    count = write(
+        name, args.columns, args.rows, args.plies, args.depth, args.workers
+    )
+    print('Wrote', count, 'positions to', name)
+
+
+if __name__ == '__main__':
+    main()
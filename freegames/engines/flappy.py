@@ -0,0 +1,186 @@
+"""Flappy engine, balls in scrolling coordinates and an autopilot.
+
+Balls all fly left at the same speed so they are stored where they would be
+if the screen flew right instead. Their positions never change: balls are
+queued oldest first, dropped from the front once off screen, and kept in a
+spatial hash. The bird is shifted into the same coordinates to look for
+collisions, at the current tick or any tick ahead.
+
+The autopilot searches tap or no tap for each of the next ticks against the
+balls already on screen. New balls appear at the right edge and take more
+than `HORIZON` ticks to reach the bird, so they cannot change the result.
+Positions of the bird are whole steps, so the search remembers every (tick,
+y) that cannot survive and never explores it twice. More balls only make a
+position worse, so those stay dead as later searches look further ahead.
+"""
+
+import random
+from collections import deque
+
+from freegames.utils import SpatialHash
+
+FALL = 5
+LIFT = 30
+SPEED = 3
+RADIUS = 15
+HORIZON = 30
+
+
+def inside(y):
+    """Return True if height `y` is within screen.
+
+    >>> inside(199), inside(-200)
+    (True, False)
+
+    """
+    return -200 < y < 200
+
+
+class Course:
+    """Balls flying left past the bird.
+
+    >>> course = Course()
+    >>> course.spawn(0)
+    >>> course.hit(199, 0)
+    True
+    >>> for tick in range(10):
+    ...     course.advance()
+    >>> course.hit(199, 0), course.hit(169, 0)
+    (False, True)
+    >>> list(course)
+    [(169, 0)]
+
+    """
+
+    def __init__(self):
+        self.tick = 0
+        self.count = 0
+        self.balls = deque()
+        self.grid = SpatialHash(RADIUS * 2)
+
+    def __len__(self):
+        return len(self.balls)
+
+    def __iter__(self):
+        """Iterate (x, y) screen positions of balls."""
+        grid = self.grid
+        shift = self.tick * SPEED
+
+        for key in self.balls:
+            x, y = grid[key]
+            yield x - shift, y
+
+    def spawn(self, y):
+        """Add ball at the right edge of the screen at height `y`."""
+        key = self.count
+        self.count += 1
+        self.balls.append(key)
+        self.grid.insert(key, 199 + self.tick * SPEED, y)
+
+    def advance(self):
+        """Move balls one tick and drop balls that left the screen."""
+        self.tick += 1
+        shift = self.tick * SPEED
+        balls = self.balls
+        grid = self.grid
+
+        while balls and grid[balls[0]][0] - shift <= -200:
+            grid.remove(balls.popleft())
+
+    def hit(self, x, y, ahead=0):
+        """Return True if a ball touches (x, y) `ahead` ticks from now."""
+        shift = (self.tick + ahead) * SPEED
+        return bool(self.grid.query(x + shift, y, RADIUS))
+
+
+class Pilot:
+    """Autopilot that taps to keep the bird alive for `horizon` ticks.
+
+    >>> course = Course()
+    >>> course.spawn(-5)
+    >>> for tick in range(65):
+    ...     course.advance()
+    >>> Pilot().tap(course, 0, 10), Pilot().tap(course, 0, 100)
+    (True, False)
+
+    """
+
+    def __init__(self, horizon=HORIZON):
+        self.horizon = horizon
+        self.dead = {}
+        self.nodes = 0
+
+    def order(self, y):
+        """Return lifts to try, steering back toward the middle first."""
+        return (0, LIFT) if y > 0 else (LIFT, 0)
+
+    def tap(self, course, x, y):
+        """Return True if the bird at (x, y) should tap before the next
+        tick.
+
+        """
+        now = course.tick
+        dead = self.dead
+
+        for tick in [tick for tick in dead if tick <= now]:
+            del dead[tick]
+
+        end = now + self.horizon
+
+        for lift in self.order(y):
+            if self.safe(course, x, y + lift - FALL, now + 1, end):
+                return lift > 0
+
+        return False
+
+    def safe(self, course, x, y, tick, end):
+        """Return True if the bird at (x, y) on `tick` can live to `end`."""
+        if not inside(y):
+            return False
+
+        dead = self.dead.setdefault(tick, set())
+
+        if y in dead:
+            return False
+
+        self.nodes += 1
+
+        if not course.hit(x, y, tick - course.tick):
+            if tick == end:
+                return True
+
+            for lift in self.order(y):
+                if self.safe(course, x, y + lift - FALL, tick + 1, end):
+                    return True
+
+        dead.add(y)
+        return False
+
+
+def play(ticks, pilot=None, rng=random):
+    """Return ticks the autopilot keeps the bird alive, at most `ticks`.
+
+    Balls appear like in the game, one in ten ticks at a random height.
+
+    >>> play(500, rng=random.Random(0))
+    500
+
+    """
+    pilot = pilot or Pilot()
+    course = Course()
+    y = 0
+
+    for count in range(ticks):
+        course.advance()
+        y -= FALL
+
+        if rng.randrange(10) == 0:
+            course.spawn(rng.randrange(-199, 199))
+
+        if not inside(y) or course.hit(0, y):
+            return count
+
+        if pilot.tap(course, 0, y):
+            y += LIFT
+
+    return ticks
@@ -0,0 +1,330 @@
+"""Minesweeper solver, deduce safe cells and mines from revealed counts.
+
+Every revealed cell gives a constraint: its hidden neighbors hold exactly
+`count` mines. Constraints that share hidden cells form a component and each
+component is solved on its own with three rules, from cheapest to most
+expensive:
+
+1. Single cell: a constraint needing no mines makes all its cells safe and a
+   constraint needing one mine per cell makes all its cells mines.
+2. Subset: when one constraint's cells are inside another's, the extra cells
+   hold the difference in mines.
+3. Enumeration: when a component has at most `limit` cells, try every
+   arrangement of mines. Cells that are never mines are safe and cells that
+   are always mines are mines.
+
+Results are cached per component so only components touched by a reveal are
+solved again. The cache is bounded and drops the least recently used
+components, which are usually ones the game has already moved past.
+"""
+
+import random
+from collections import OrderedDict
+
+from freegames.engines.minesweeper import Board
+
+
+def simplify(constraints, safe, mines):
+    """Return constraints without the known `safe` and `mines` cells.
+
+    >>> simplify([(frozenset([1, 2]), 1)], {1}, set())
+    [(frozenset({2}), 1)]
+
+    """
+    result = []
+
+    for cells, need in constraints:
+        need -= len(cells & mines)
+        cells = cells - safe - mines
+        if cells:
+            result.append((cells, need))
+
+    return result
+
+
+def single(constraints, safe, mines):
+    """Apply single cell rule and return True if anything was deduced."""
+    found = False
+
+    for cells, need in constraints:
+        if need == 0:
+            safe |= cells
+            found = True
+        elif need == len(cells):
+            mines |= cells
+            found = True
+
+    return found
+
+
+def subset(constraints, safe, mines):
+    """Apply subset rule and return True if anything was deduced."""
+    found = False
+
+    for small, small_need in constraints:
+        for large, large_need in constraints:
+            if small < large:
+                rest = large - small
+                need = large_need - small_need
+                if need == 0:
+                    safe |= rest
+                    found = True
+                elif need == len(rest):
+                    mines |= rest
+                    found = True
+
+    return found
+
+
+def enumerate_mines(constraints, safe, mines, limit):
+    """Apply enumeration rule and return True if anything was deduced.
+
+    Nothing is tried when the constraints cover more than `limit` cells.
+
+    """
+    order = sorted(set().union(*(cells for cells, need in constraints)))
+
+    if len(order) > limit:
+        return False
+
+    watch = {cell: [] for cell in order}
+    needs = []
+    left = []
+
+    for index, (cells, need) in enumerate(constraints):
+        needs.append(need)
+        left.append(len(cells))
+        for cell in cells:
+            watch[cell].append(index)
+
+    tally = dict.fromkeys(order, 0)
+    chosen = []
+    solutions = 0
+
+    def search(position):
+        nonlocal solutions
+
+        if position == len(order):
+            solutions += 1
+            for cell in chosen:
+                tally[cell] += 1
+            return
+
+        cell = order[position]
+
+        for value in (0, 1):
+            indexes = watch[cell]
+            for index in indexes:
+                needs[index] -= value
+                left[index] -= 1
+
+            if all(0 <= needs[index] <= left[index] for index in indexes):
+                if value:
+                    chosen.append(cell)
+                search(position + 1)
+                if value:
+                    chosen.pop()
+
+            for index in indexes:
+                needs[index] += value
+                left[index] += 1
+
+    search(0)
+
+    if solutions == 0:
+        return False
+
+    found = False
+
+    for cell, count in tally.items():
+        if count == 0:
+            safe.add(cell)
+            found = True
+        elif count == solutions:
+            mines.add(cell)
+            found = True
+
+    return found
+
+
+def deduce(constraints, limit=16):
+    """Return sets of safe cells and mines implied by constraints.
+
+    >>> deduce([(frozenset([1, 2, 3]), 1), (frozenset([1, 2]), 1)])
+    ({3}, set())
+
+    """
+    safe = set()
+    mines = set()
+    rules = [single, subset]
+
+    while True:
+        constraints = simplify(constraints, safe, mines)
+
+        if not constraints:
+            break
+
+        if any(rule(constraints, safe, mines) for rule in rules):
+            continue
+
+        if not enumerate_mines(constraints, safe, mines, limit):
+            break
+
+    return safe, mines
+
+
+class Solver:
+    """Minesweeper solver for `board` that learns from revealed cells.
+
+    Call `update` with cells as they are revealed. Cells may be any index the
+    board understands so the solver works with infinite boards too. At most
+    `capacity` component results are cached.
+
+    >>> board = Board(3, 1, 0)
+    >>> board.mines[2] = 1
+    >>> board.counts[:] = bytes([0, 1, 1])
+    >>> solver = Solver(board)
+    >>> solver.update(board.reveal(0))
+    >>> solver.solve()
+    (set(), {2})
+
+    """
+
+    def __init__(self, board, limit=16, capacity=1 << 12):
+        self.board = board
+        self.limit = limit
+        self.capacity = capacity
+        self.safe = set()
+        self.mines = set()
+        self.touched = set()
+        self.cache = OrderedDict()
+
+    def update(self, cells):
+        """Learn that `cells` were revealed."""
+        for cell in cells:
+            self.safe.discard(cell)
+            self.touched.add(cell)
+            self.touch(cell)
+
+    def touch(self, cell):
+        """Mark revealed neighbors of `cell` to be solved again."""
+        shown = self.board.shown
+        self.touched.update(
+            other for other in self.board.around(cell) if shown[other]
+        )
+
+    def constraint(self, cell):
+        """Return (cells, need) for revealed `cell` or None if complete."""
+        board = self.board
+        cells = []
+        need = board.counts[cell]
+
+        for other in board.around(cell):
+            if other in self.mines:
+                need -= 1
+            elif not board.shown[other] and other not in self.safe:
+                cells.append(other)
+
+        return (frozenset(cells), need) if cells else None
+
+    def component(self, cell):
+        """Return constraints connected to revealed `cell` by hidden cells."""
+        board = self.board
+        constraints = set()
+        seen = {cell}
+        stack = [cell]
+
+        while stack:
+            cell = stack.pop()
+            self.touched.discard(cell)
+            pair = self.constraint(cell)
+
+            if pair is None:
+                continue
+
+            constraints.add(pair)
+
+            for hidden in pair[0]:
+                for other in board.around(hidden):
+                    if board.shown[other] and other not in seen:
+                        seen.add(other)
+                        stack.append(other)
+
+        return frozenset(constraints)
+
+    def solve(self):
+        """Solve touched components and return sets of safe cells and mines.
+
+        Safe cells are hidden cells that can be revealed without risk.
+
+        """
+        while self.touched:
+            cell = self.touched.pop()
+            constraints = self.component(cell)
+
+            if not constraints:
+                continue
+
+            cache = self.cache
+            result = cache.get(constraints)
+
+            if result is None:
+                result = deduce(list(constraints), self.limit)
+                cache[constraints] = result
+                if len(cache) > self.capacity:
+                    cache.popitem(last=False)
+            else:
+                cache.move_to_end(constraints)
+
+            safe, mines = result
+
+            for spot in (safe - self.safe) | (mines - self.mines):
+                self.touch(spot)
+
+            self.safe |= safe
+            self.mines |= mines
+
+        return self.safe, self.mines
+
+    def hint(self):
+        """Return a hidden cell that is safe to reveal or None."""
+        safe, mines = self.solve()
+        return min(safe) if safe else None
+
+
+def solvable(board, start):
+    """Return True if every safe cell of `board` can be revealed from `start`
+    without guessing.
+
+    """
+    solver = Solver(board)
+    solver.update(board.reveal(start))
+    safe, mines = solver.solve()
+
+    while safe:
+        for cell in list(safe):
+            solver.update(board.reveal(cell))
+        safe, mines = solver.solve()
+
+    return sum(board.shown) + sum(board.mines) == len(board.mines)
+
+
+def generate(columns, rows, mines, start, rng=random, tries=1000):
+    """Return board that can be solved from `start` without guessing.
+
+    Boards are drawn at random until one is solvable. Raise ValueError after
+    `tries` boards.
+
+    >>> board = generate(8, 8, 10, 0, random.Random(0))
+    >>> sum(board.mines), sum(board.shown)
+    (10, 0)
+
+    """
+    for count in range(tries):
+        board = Board(columns, rows, mines, rng, safe=start)
+
+        if solvable(board, start):
+            board.shown[:] = bytes(len(board.shown))
+            return board
+
+    raise ValueError('no board found without guessing')
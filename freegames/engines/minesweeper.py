@@ -0,0 +1,370 @@
+"""Minesweeper engine, boards stored in flat byte arrays.
+
+Cells are numbered row by row: the cell at `column` and `row` has index
+`column + row * columns`. Each board keeps three byte arrays with one byte per
+cell so a 1000x1000 board needs about three megabytes.
+
+Infinite boards have no edges. Their cells are indexed by `(column, row)`
+pairs and are grouped into square chunks that are created only when needed.
+"""
+
+import hashlib
+import random
+from collections import OrderedDict
+from operator import add
+
+SIZE = 16
+SPARSEST = 0.12
+
+
+def tally(mines, columns, rows):
+    """Return count of mines in the 3x3 block around each cell.
+
+    The mines are copied into a grid padded with a border of empty cells. Then
+    the grid is summed with its left and right neighbors and the result is
+    summed with its upper and lower neighbors. Each sum is one pass over the
+    whole grid.
+
+    >>> mines = bytes([1, 0, 0, 0, 0, 0])
+    >>> list(tally(mines, 3, 2))
+    [1, 1, 0, 1, 1, 0]
+
+    """
+    width = columns + 2
+    border = bytes(width)
+    rows_padded = [border]
+
+    for row in range(rows):
+        start = row * columns
+        stop = start + columns
+        rows_padded.append(b'\0' + mines[start:stop] + b'\0')
+
+    rows_padded.append(border)
+    grid = b''.join(rows_padded)
+    across = b'\0' + bytes(map(add, map(add, grid, grid[1:]), grid[2:]))
+    below = across[width:]
+    above = below[width:]
+    down = bytes(map(add, map(add, across, below), above))
+    counts = bytearray()
+
+    for start in range(1, rows * width, width):
+        stop = start + columns
+        counts += down[start:stop]
+
+    return counts
+
+
+class Board:
+    """Minesweeper board with `columns` by `rows` cells and `mines` mines.
+
+    When `safe` is a cell index, no mines are placed in the 3x3 block around
+    it so the first tap there always opens a region.
+
+    >>> board = Board(4, 3, 2, random.Random(0))
+    >>> sum(board.mines)
+    2
+    >>> board.cell(3, 2)
+    11
+
+    """
+
+    def __init__(self, columns=8, rows=8, mines=8, rng=random, safe=None):
+        self.columns = columns
+        self.rows = rows
+        size = columns * rows
+        self.mines = bytearray(size)
+        spots = range(size)
+
+        if safe is not None:
+            block = set(self.around(safe))
+            spots = [spot for spot in spots if spot not in block]
+
+        for index in rng.sample(spots, mines):
+            self.mines[index] = 1
+
+        self.counts = tally(self.mines, columns, rows)
+        self.shown = bytearray(size)
+
+    def cell(self, column, row):
+        """Return index of cell at `column` and `row`."""
+        return column + row * self.columns
+
+    def position(self, index):
+        """Return (column, row) of cell `index`."""
+        return index % self.columns, index // self.columns
+
+    def inside(self, column, row):
+        """Return True if `column` and `row` are on the board."""
+        return 0 <= column < self.columns and 0 <= row < self.rows
+
+    def focus(self, column, row, columns, rows):
+        """Show that `columns` by `rows` cells from `column` and `row` are in
+        view. Finite boards keep every cell in memory so nothing changes.
+
+        """
+
+    def around(self, index):
+        """Return indexes of cells in the 3x3 block around cell `index`.
+
+        >>> board = Board(3, 3, 0)
+        >>> board.around(0)
+        [0, 1, 3, 4]
+
+        """
+        columns = self.columns
+        column, row = index % columns, index // columns
+        xs = range(max(column - 1, 0), min(column + 2, columns))
+        ys = range(
+            max(row - 1, 0) * columns,
+            min(row + 2, self.rows) * columns,
+            columns,
+        )
+        return [x + y for y in ys for x in xs]
+
+    def reveal(self, index):
+        """Show cell `index` and flood out through cells with no mines around.
+
+        Cells are marked shown as soon as they are queued so every cell is
+        queued at most once and revealing a region takes linear time. Return
+        list of newly shown cells.
+
+        >>> board = Board(3, 3, 0)
+        >>> board.reveal(4)
+        [4, 0, 1, 2, 3, 5, 6, 7, 8]
+        >>> board.reveal(0)
+        []
+
+        """
+        shown = self.shown
+
+        if shown[index]:
+            return []
+
+        shown[index] = 1
+        spots = [index]
+
+        for spot in spots:
+            if self.counts[spot] == 0:
+                for other in self.around(spot):
+                    if not shown[other]:
+                        shown[other] = 1
+                        spots.append(other)
+
+        return spots
+
+
+class Layer:
+    """Indexable view of one layer of an infinite board."""
+
+    def __init__(self, get, put=None):
+        self.get = get
+        self.put = put
+
+    def __getitem__(self, index):
+        return self.get(index)
+
+    def __setitem__(self, index, value):
+        self.put(index, value)
+
+
+class Chunk:
+    """Square block of `SIZE` by `SIZE` cells of an infinite board."""
+
+    __slots__ = ('counts', 'shown')
+
+    def __init__(self, counts, shown):
+        self.counts = counts
+        self.shown = shown
+
+
+class InfiniteBoard(Board):
+    """Minesweeper board without edges.
+
+    Mines are never stored. Each chunk of cells derives its mines from a hash
+    of `seed` and the chunk coordinates, with about `density` of cells mined.
+    The 3x3 block around (0, 0) never has mines so the game can start there.
+
+    Chunks are created when a reveal reaches them and kept in a least recently
+    used cache of `capacity` chunks. Chunks outside the view are evicted when
+    the cache is full and only their shown cells are kept, packed into an
+    integer, so memory grows with the explored area and not the world size.
+
+    Below `SPARSEST` density the regions of cells with no mines around stop
+    being small islands and a single reveal can flood out without end, so
+    lower densities raise ValueError.
+
+    >>> board = InfiniteBoard(seed=0)
+    >>> board.mines[0, 0], board.counts[0, 0]
+    (0, 0)
+    >>> spots = board.reveal((0, 0))
+    >>> board.shown[1, 1]
+    1
+
+    """
+
+    columns = rows = None
+
+    def __init__(self, seed=0, density=0.15, capacity=64):
+        if density < SPARSEST:
+            raise ValueError('density must be at least {}'.format(SPARSEST))
+
+        self.seed = seed
+        level = round(density * 256)
+        self.table = bytes(int(value < level) for value in range(256))
+        self.capacity = capacity
+        self.chunks = OrderedDict()
+        self.explored = {}
+        self.view = set()
+        self.mines = Layer(self.mine)
+        self.counts = Layer(self.count)
+        self.shown = Layer(self.seen, self.show)
+
+    def cell(self, column, row):
+        """Return index of cell at `column` and `row`."""
+        return column, row
+
+    def position(self, index):
+        """Return (column, row) of cell `index`."""
+        return index
+
+    def inside(self, column, row):
+        """Return True because every cell is on an infinite board."""
+        return True
+
+    def around(self, index):
+        """Return indexes of cells in the 3x3 block around cell `index`."""
+        column, row = index
+        return [(column + x, row + y) for y in (-1, 0, 1) for x in (-1, 0, 1)]
+
+    def split(self, index):
+        """Return chunk key and offset within chunk of cell `index`.
+
+        >>> InfiniteBoard().split((-1, 17))
+        ((-1, 1), 31)
+
+        """
+        column, row = index
+        key = column // SIZE, row // SIZE
+        return key, column % SIZE + row % SIZE * SIZE
+
+    def layout(self, key):
+        """Return mines of chunk `key` as bytes derived from a hash."""
+        name = '{}:{}:{}'.format(self.seed, *key).encode()
+        digest = hashlib.shake_128(name).digest(SIZE * SIZE)
+        mines = bytearray(digest.translate(self.table))
+
+        for x in (-1, 0, 1):
+            for y in (-1, 0, 1):
+                spot_key, offset = self.split((x, y))
+                if spot_key == key:
+                    mines[offset] = 0
+
+        return mines
+
+    def mine(self, index):
+        """Return 1 if cell `index` has a mine without creating its chunk."""
+        key, offset = self.split(index)
+        return self.layout(key)[offset]
+
+    def chunk(self, key):
+        """Return chunk `key`, creating it if needed."""
+        chunks = self.chunks
+
+        if key in chunks:
+            chunks.move_to_end(key)
+            return chunks[key]
+
+        column, row = key
+        width = SIZE + 2
+        layouts = {
+            (x, y): self.layout((column + x, row + y))
+            for x in (-1, 0, 1)
+            for y in (-1, 0, 1)
+        }
+        padded = bytearray()
+
+        for y in range(-1, SIZE + 1):
+            for x in range(-1, SIZE + 1):
+                spot_key, offset = self.split((x, y))
+                padded.append(layouts[spot_key][offset])
+
+        around = tally(padded, width, width)
+        counts = bytearray()
+
+        for start in range(width + 1, width * (SIZE + 1), width):
+            stop = start + SIZE
+            counts += around[start:stop]
+
+        bits = self.explored.pop(key, 0)
+        shown = bytearray((bits >> offset) & 1 for offset in range(SIZE**2))
+        chunk = chunks[key] = Chunk(counts, shown)
+        self.evict(key)
+        return chunk
+
+    def evict(self, keep=None):
+        """Evict least recently used chunks outside the view, except chunk
+        `keep`.
+
+        """
+        chunks = self.chunks
+
+        for key in list(chunks):
+            if len(chunks) <= self.capacity:
+                break
+
+            if key not in self.view and key != keep:
+                shown = chunks.pop(key).shown
+                bits = 0
+
+                for offset, value in enumerate(shown):
+                    bits |= value << offset
+
+                if bits:
+                    self.explored[key] = bits
+
+    def focus(self, column, row, columns, rows):
+        """Show that `columns` by `rows` cells from `column` and `row` are in
+        view. Chunks in view are kept and the rest may be evicted.
+
+        Raise ValueError if the view needs more chunks than `capacity`.
+
+        """
+        left = column // SIZE
+        bottom = row // SIZE
+        right = (column + columns - 1) // SIZE
+        top = (row + rows - 1) // SIZE
+        view = {
+            (x, y)
+            for x in range(left, right + 1)
+            for y in range(bottom, top + 1)
+        }
+
+        if len(view) > self.capacity:
+            raise ValueError('view needs more chunks than capacity')
+
+        self.view = view
+
+        for key in self.view:
+            if key in self.chunks:
+                self.chunks.move_to_end(key)
+
+        self.evict()
+
+    def count(self, index):
+        """Return count of mines around cell `index`."""
+        key, offset = self.split(index)
+        return self.chunk(key).counts[offset]
+
+    def seen(self, index):
+        """Return 1 if cell `index` is shown without creating its chunk."""
+        key, offset = self.split(index)
+
+        if key in self.chunks:
+            return self.chunks[key].shown[offset]
+
+        return (self.explored.get(key, 0) >> offset) & 1
+
+    def show(self, index, value):
+        """Set shown `value` of cell `index`."""
+        key, offset = self.split(index)
+        self.chunk(key).shown[offset] = value
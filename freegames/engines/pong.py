@@ -0,0 +1,148 @@
+"""Pong engine, many balls with swept collisions.
+
+Balls keep positions and aims in the parallel arrays of `Bodies` and all
+move in one bulk pass per frame. Only balls that end a frame past a wall or
+a paddle line are looked at again. Those are tested along the segment
+they moved, not at their end point, so a fast ball bounces off a paddle it
+jumped over and off a wall at the exact point it crossed.
+
+Walls reflect the ball, so its height bounces between `BOTTOM` and `TOP`
+like a triangle wave. Folding the straight line `y + t * dy` into the wave
+gives the height after any time `t` in constant time, with no frames
+stepped. That also predicts where a ball will cross a paddle line.
+"""
+
+from freegames.engines.bodies import Bodies
+
+TOP = 200
+BOTTOM = -200
+LEFT = -185
+RIGHT = 185
+PADDLE = 50
+
+
+def fold(height, low=BOTTOM, high=TOP):
+    """Return `height` on a straight line folded between `low` and `high`.
+
+    >>> fold(250), fold(-650)
+    (150, 150)
+
+    """
+    span = high - low
+    offset = (height - low) % (2 * span)
+
+    if offset > span:
+        offset = 2 * span - offset
+
+    return low + offset
+
+
+def bounce(y, dy):
+    """Return height and aim of a ball that moved to `y` with aim `dy`,
+    after bouncing off the walls.
+
+    >>> bounce(210, 15), bounce(-1030, -40)
+    ((190, -15), (-170, 40))
+
+    """
+    span = TOP - BOTTOM
+    offset = (y - BOTTOM) % (2 * span)
+
+    if offset > span:
+        return BOTTOM + 2 * span - offset, -dy
+
+    return BOTTOM + offset, dy
+
+
+def intercept(x, y, dx, dy, plane):
+    """Return (time, height) when a ball at (x, y) moving (dx, dy) per frame
+    crosses the vertical line at `plane`.
+
+    The ball must be moving toward the line. Time counts frames and may be
+    fractional.
+
+    >>> intercept(0, 0, 4, 3, 184)
+    (46.0, 138.0)
+    >>> intercept(0, 190, 5, 4, 185)
+    (37.0, 62.0)
+
+    """
+    time = (plane - x) / dx
+    return time, fold(y + time * dy)
+
+
+def clear(x, y):
+    """Return True if (x, y) is between the paddle lines and the walls.
+
+    >>> clear(0, 0), clear(190, 0)
+    (True, False)
+
+    """
+    return LEFT <= x <= RIGHT and BOTTOM <= y <= TOP
+
+
+class Court:
+    """Balls bouncing between two paddles.
+
+    Paddles are `PADDLE` tall and stand on the `LEFT` and `RIGHT` lines.
+    Balls should move less than the width of the court per frame.
+
+    >>> court = Court()
+    >>> court.serve(180, 0, 30, 0)
+    >>> court.step(0, -20)
+    0
+    >>> list(court.balls.xs), list(court.balls.dxs)
+    ([160.0], [-30.0])
+    >>> court.serve(-180, 100, -30, 0)
+    >>> court.step(0, 0)
+    1
+    >>> list(court.balls.xs)
+    [130.0]
+
+    """
+
+    def __init__(self):
+        self.balls = Bodies()
+
+    def serve(self, x, y, dx, dy):
+        """Add ball at (x, y) moving (dx, dy) per frame."""
+        self.balls.add(x, y, dx, dy)
+
+    def step(self, left, right):
+        """Move balls one frame and return number that got past a paddle.
+
+        `left` and `right` are the bottom edges of the paddles. Balls that
+        get past are removed.
+
+        """
+        balls = self.balls
+        xs, ys, dxs, dys = balls.xs, balls.ys, balls.dxs, balls.dys
+        balls.move()
+        loose = [
+            index for index, flag in enumerate(map(clear, xs, ys)) if not flag
+        ]
+        flags = None
+
+        for index in loose:
+            x, y = xs[index], ys[index]
+            dx, dy = dxs[index], dys[index]
+            ys[index], dys[index] = bounce(y, dy)
+
+            if LEFT <= x <= RIGHT:
+                continue
+
+            plane, low = (LEFT, left) if x < LEFT else (RIGHT, right)
+            time, height = intercept(x - dx, y - dy, dx, dy, plane)
+
+            if low <= height <= low + PADDLE:
+                xs[index] = 2 * plane - x
+                dxs[index] = -dx
+            else:
+                flags = flags or [True] * len(balls)
+                flags[index] = False
+
+        if flags is None:
+            return 0
+
+        balls.keep(flags)
+        return flags.count(False)
@@ -0,0 +1,350 @@
+"""Tic-tac-toe engine, m,n,k boards stored in bit masks.
+
+A board has `columns` by `rows` cells and a player wins with `length` in a
+row. Cells are numbered row by row from the bottom left and each player's
+marks are one integer with a bit per cell. Every line of `length` cells is
+precomputed as a mask. Boards also keep a mask of marked cells and count
+each player's marks on every line as moves are made, so checking a cell is
+empty or that a line is complete takes constant time.
+
+The computer player searches with alpha-beta negamax. Positions are looked
+up in a bounded cache under their canonical key: the smallest key among all
+rotations and reflections of the board, so symmetric positions are searched
+once. Big boards like 7x7 with 5 in a row are too large to search to the end
+and are searched to a fixed depth instead.
+"""
+
+from collections import OrderedDict
+
+WIN = 1000
+EXACT, LOWER, UPPER = 0, 1, 2
+
+
+def lines(columns, rows, length):
+    """Return list of masks for each line of `length` cells.
+
+    >>> [bin(mask) for mask in lines(2, 2, 2)]
+    ['0b11', '0b1100', '0b101', '0b1010', '0b1001', '0b110']
+
+    """
+    masks = []
+
+    for x, y in [(1, 0), (0, 1), (1, 1), (-1, 1)]:
+        for row in range(rows):
+            for column in range(columns):
+                last_column = column + x * (length - 1)
+                last_row = row + y * (length - 1)
+                if 0 <= last_column < columns and last_row < rows:
+                    mask = 0
+                    for step in range(length):
+                        cell = column + x * step + (row + y * step) * columns
+                        mask |= 1 << cell
+                    masks.append(mask)
+
+    return masks
+
+
+def symmetries(columns, rows):
+    """Return list of cell permutations that map the board onto itself.
+
+    Entry `cell` of a permutation is where that cell moves to. Square boards
+    have eight symmetries and other boards have four.
+
+    >>> len(symmetries(3, 3)), len(symmetries(4, 3))
+    (8, 4)
+
+    """
+    moves = [
+        lambda x, y: (x, y),
+        lambda x, y: (columns - 1 - x, y),
+        lambda x, y: (x, rows - 1 - y),
+        lambda x, y: (columns - 1 - x, rows - 1 - y),
+    ]
+
+    if columns == rows:
+        moves += [
+            lambda x, y: (y, x),
+            lambda x, y: (rows - 1 - y, x),
+            lambda x, y: (y, columns - 1 - x),
+            lambda x, y: (rows - 1 - y, columns - 1 - x),
+        ]
+
+    result = []
+
+    for move in moves:
+        permutation = []
+        for cell in range(columns * rows):
+            x, y = move(cell % columns, cell // columns)
+            permutation.append(x + y * columns)
+        result.append(permutation)
+
+    return result
+
+
+def tables(permutation):
+    """Return lookup tables that apply `permutation` to a mask a byte at a
+    time.
+
+    Entry `[place][byte]` holds the moved bits of `byte` at byte `place`.
+
+    """
+    result = []
+
+    for start in range(0, len(permutation), 8):
+        table = []
+        for byte in range(256):
+            bits = 0
+            for offset in range(8):
+                cell = start + offset
+                if byte >> offset & 1 and cell < len(permutation):
+                    bits |= 1 << permutation[cell]
+            table.append(bits)
+        result.append(table)
+
+    return result
+
+
+class Board:
+    """Tic-tac-toe board with `columns` by `rows` cells and `length` in a row
+    to win. Players take turns starting with player 0.
+
+    >>> board = Board()
+    >>> for cell in [0, 3, 1, 4]:
+    ...     board.play(cell)
+    >>> board.won()
+    False
+    >>> board.play(2)
+    >>> board.won()
+    True
+
+    """
+
+    def __init__(self, columns=3, rows=3, length=3):
+        self.columns = columns
+        self.rows = rows
+        self.length = length
+        self.size = columns * rows
+        self.lines = lines(columns, rows, length)
+        self.through = [
+            [
+                index
+                for index, mask in enumerate(self.lines)
+                if mask >> cell & 1
+            ]
+            for cell in range(self.size)
+        ]
+        self.tables = [tables(item) for item in symmetries(columns, rows)]
+        self.players = [0, 0]
+        self.occupied = 0
+        self.counts = [[0] * len(self.lines), [0] * len(self.lines)]
+        self.complete = 0
+        self.moves = []
+
+    @property
+    def player(self):
+        """Player to move next, 0 or 1."""
+        return len(self.moves) % 2
+
+    def playable(self, cell):
+        """Return True if `cell` is on the board and empty."""
+        return 0 <= cell < self.size and not self.occupied >> cell & 1
+
+    def play(self, cell):
+        """Mark `cell` for the player to move.
+
+        The player's mark count goes up on every line through `cell` and
+        lines reaching `length` marks are counted as complete.
+
+        """
+        counts = self.counts[self.player]
+
+        for index in self.through[cell]:
+            counts[index] += 1
+            if counts[index] == self.length:
+                self.complete += 1
+
+        self.players[self.player] |= 1 << cell
+        self.occupied |= 1 << cell
+        self.moves.append(cell)
+
+    def undo(self):
+        """Take back the last move."""
+        cell = self.moves.pop()
+        counts = self.counts[self.player]
+
+        for index in self.through[cell]:
+            if counts[index] == self.length:
+                self.complete -= 1
+            counts[index] -= 1
+
+        self.players[self.player] ^= 1 << cell
+        self.occupied ^= 1 << cell
+
+    def won(self):
+        """Return True if a player has completed a line."""
+        return self.complete > 0
+
+    def full(self):
+        """Return True if every cell is marked."""
+        return len(self.moves) == self.size
+
+    def key(self):
+        """Return canonical key of the position, the same for every rotation
+        and reflection of the board.
+
+        >>> first, second = Board(), Board()
+        >>> first.play(0)
+        >>> second.play(8)
+        >>> first.key() == second.key()
+        True
+
+        """
+        current = self.players[self.player]
+        other = self.players[1 - self.player]
+        keys = []
+
+        for table in self.tables:
+            mine = theirs = 0
+            for place, lookup in enumerate(table):
+                shift = place * 8
+                mine |= lookup[current >> shift & 255]
+                theirs |= lookup[other >> shift & 255]
+            keys.append((mine, theirs))
+
+        return min(keys)
+
+    def score(self):
+        """Return lines still open to the player to move minus lines still
+        open to the other player.
+
+        """
+        mine = self.counts[self.player]
+        theirs = self.counts[1 - self.player]
+        total = 0
+
+        for count, other in zip(mine, theirs):
+            if not other:
+                total += 1
+            if not count:
+                total -= 1
+
+        return total
+
+
+class Player:
+    """Computer player that searches `depth` moves ahead.
+
+    With no `depth` the search plays perfectly by searching to the end of
+    the game. At most `capacity` positions are cached, dropping the least
+    recently used. Scores count from the view of the player to move: winning
+    with more empty cells left scores higher.
+
+    >>> board = Board()
+    >>> for cell in [4, 0, 8]:
+    ...     board.play(cell)
+    >>> Player().move(board) in (2, 6)
+    True
+
+    """
+
+    def __init__(self, depth=None, capacity=1 << 16):
+        self.depth = depth
+        self.capacity = capacity
+        self.cache = OrderedDict()
+        self.nodes = 0
+
+    def order(self, board):
+        """Return empty cells sorted from the center out."""
+        columns, rows = board.columns, board.rows
+
+        def distance(cell):
+            x, y = cell % columns, cell // columns
+            return abs(2 * x - columns + 1) + abs(2 * y - rows + 1)
+
+        cells = [cell for cell in range(board.size) if board.playable(cell)]
+        return sorted(cells, key=distance)
+
+    def move(self, board):
+        """Return best cell for the player to move."""
+        empty = board.size - len(board.moves)
+        depth = min(empty, self.depth or empty)
+        alpha = -WIN * 2
+        seen = set()
+        choice = None
+
+        for cell in self.order(board):
+            board.play(cell)
+            key = board.key()
+
+            if key not in seen:
+                seen.add(key)
+                value = -self.negamax(board, depth - 1, -WIN * 2, -alpha)
+                if value > alpha:
+                    alpha = value
+                    choice = cell
+
+            board.undo()
+
+        return choice
+
+    def negamax(self, board, depth, alpha, beta):
+        """Return value of `board` searched to `depth` in window alpha-beta."""
+        self.nodes += 1
+        empty = board.size - len(board.moves)
+
+        if board.won():
+            return -(WIN + empty)
+
+        if empty == 0:
+            return 0
+
+        if depth == 0:
+            return board.score()
+
+        start = alpha
+        key = board.key()
+        cache = self.cache
+        entry = cache.get(key)
+
+        if entry is not None:
+            cache.move_to_end(key)
+            stored, flag, value = entry
+            if stored >= depth:
+                if flag == EXACT:
+                    return value
+                if flag == LOWER:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value
+
+        best = -WIN * 2
+
+        for cell in self.order(board):
+            board.play(cell)
+            value = -self.negamax(board, depth - 1, -beta, -alpha)
+            board.undo()
+
+            if value > best:
+                best = value
+
+            if value > alpha:
+                alpha = value
+
+            if alpha >= beta:
+                break
+
+        if best <= start:
+            flag = UPPER
+        elif best >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+
+        cache[key] = depth, flag, best
+
+        if len(cache) > self.capacity:
+            cache.popitem(last=False)
+
+        return best
@@ -0,0 +1,458 @@
+"""Tiles engine, sliding puzzle boards stored in flat lists.
+
+A board of `size` by `size` cells is a list of numbers read row by row from
+the bottom left. The blank cell is None. The solved board counts up from 1
+and ends with the blank.
+
+Optimal solutions are found with IDA* search guided by additive pattern
+databases. Each database covers a group of tiles and stores, for every
+placement of those tiles, the fewest moves of group tiles needed to reach
+their solved cells. Groups share no tiles so their moves add up to a lower
+bound on the whole solution. Databases are built once, saved as byte arrays
+in the engines cache directory, and memory-mapped on later runs. Building
+them takes a while so build them ahead of time from the command-line::
+
+  $ python3 -m freegames.engines.tiles --size 4
+
+Some boards take a long time to solve optimally even with the databases, so
+searches run for a time budget and may be resumed later, a slice at a time.
+"""
+
+import argparse
+import mmap
+import os
+import random
+import time
+
+from freegames.engines import cache
+
+PATTERNS = {
+    3: ((1, 2, 3, 4), (5, 6, 7, 8)),
+    4: ((1, 2, 3, 5, 6), (4, 7, 8, 11, 12), (9, 10, 13, 14, 15)),
+}
+
+
+def solved(size):
+    """Return solved board of `size` by `size` cells.
+
+    >>> solved(2)
+    [1, 2, 3, None]
+
+    """
+    return list(range(1, size * size)) + [None]
+
+
+def parity(tiles):
+    """Return parity of the permutation that sorts tiles, blank last.
+
+    Counting cycles takes linear time.
+
+    >>> parity([2, 1, 3, None])
+    1
+
+    """
+    count = len(tiles)
+    places = [count - 1 if tile is None else tile - 1 for tile in tiles]
+    seen = bytearray(count)
+    swaps = 0
+
+    for start in range(count):
+        if not seen[start]:
+            length = 0
+            index = start
+            while not seen[index]:
+                seen[index] = 1
+                index = places[index]
+                length += 1
+            swaps += length - 1
+
+    return swaps % 2
+
+
+def solvable(tiles, size):
+    """Return True if tiles can be slid back to the solved board.
+
+    Every slide swaps the blank with a neighbor. That flips the parity of the
+    permutation and moves the blank one step, so the two parities must match.
+
+    >>> solvable([1, 2, 3, None], 2)
+    True
+    >>> solvable([2, 1, 3, None], 2)
+    False
+
+    """
+    blank = tiles.index(None)
+    column, row = blank % size, blank // size
+    steps = (size - 1 - column) + (size - 1 - row)
+    return parity(tiles) == steps % 2
+
+
+def scramble(size, rng=random):
+    """Return uniformly random solvable board of `size` by `size` cells.
+
+    Shuffle all the cells. If the board cannot be solved, swap the first two
+    numbered tiles to fix the parity. Swapping pairs solvable and unsolvable
+    boards one to one so every solvable board is equally likely.
+
+    >>> tiles = scramble(4, random.Random(0))
+    >>> sorted(tiles, key=lambda tile: tile or 16) == solved(4)
+    True
+    >>> solvable(tiles, 4)
+    True
+
+    """
+    tiles = solved(size)
+    rng.shuffle(tiles)
+
+    if not solvable(tiles, size):
+        first, second = [
+            index for index, tile in enumerate(tiles[:3]) if tile is not None
+        ][:2]
+        tiles[first], tiles[second] = tiles[second], tiles[first]
+
+    return tiles
+
+
+def distance(tiles, size):
+    """Return sum of Manhattan distances of tiles from their solved cells.
+
+    Every slide moves one tile one step so this is a lower bound on the moves
+    needed to solve the board.
+
+    >>> distance([1, 2, None, 3], 2)
+    1
+
+    """
+    total = 0
+
+    for index, tile in enumerate(tiles):
+        if tile is not None:
+            goal = tile - 1
+            total += abs(index % size - goal % size)
+            total += abs(index // size - goal // size)
+
+    return total
+
+
+def neighbors(size):
+    """Return list of neighbor cells for each cell of `size` by `size` board.
+
+    >>> neighbors(2)
+    [[1, 2], [0, 3], [3, 0], [2, 1]]
+
+    """
+    table = []
+
+    for index in range(size * size):
+        column, row = index % size, index // size
+        spots = []
+        if column < size - 1:
+            spots.append(index + 1)
+        if column > 0:
+            spots.append(index - 1)
+        if row < size - 1:
+            spots.append(index + size)
+        if row > 0:
+            spots.append(index - size)
+        table.append(spots)
+
+    return table
+
+
+def patterns(size):
+    """Return groups of tiles with a pattern database each.
+
+    >>> patterns(5)[0]
+    (1, 2, 3)
+
+    """
+    if size in PATTERNS:
+        return PATTERNS[size]
+
+    tiles = range(1, size * size)
+    starts = range(0, len(tiles), 3)
+    return tuple(tuple(tiles[start:][:3]) for start in starts)
+
+
+def build(size, group):
+    """Return pattern database for `group` tiles as a bytearray.
+
+    Entry `sum(cell * count ** place)` holds the fewest moves of group tiles
+    from the cells of the group tiles to their solved cells, where `count` is
+    the number of cells and `place` is the tile's place in the group. Other
+    tiles are ignored, so a group tile may move into any cell not held by
+    another group tile. Entries that cannot be reached hold 255.
+
+    """
+    count = size * size
+    table = neighbors(size)
+    weights = [count**place for place in range(len(group))]
+    moves = bytearray([255]) * (count ** len(group))
+    start = sum((tile - 1) * weight for tile, weight in zip(group, weights))
+    moves[start] = 0
+    frontier = [start]
+    depth = 0
+
+    while frontier:
+        depth += 1
+        following = []
+
+        for index in frontier:
+            cells = []
+            for weight in weights:
+                cells.append(index // weight % count)
+
+            for cell, weight in zip(cells, weights):
+                for spot in table[cell]:
+                    if spot not in cells:
+                        other = index + (spot - cell) * weight
+                        if moves[other] == 255:
+                            moves[other] = depth
+                            following.append(other)
+
+        frontier = following
+
+    return moves
+
+
+class Timeout(Exception):
+    """Raised when a search runs out of time."""
+
+
+def location(size, group):
+    """Return filename of pattern database for `group` tiles in the engines
+    cache directory.
+
+    """
+    name = 'tiles-{}-{}.pdb'.format(size, '-'.join(map(str, group)))
+    return cache(name)
+
+
+def ready(size):
+    """Return True if every pattern database for `size` is already built."""
+    return all(
+        os.path.exists(location(size, group)) for group in patterns(size)
+    )
+
+
+def database(size, group):
+    """Return pattern database for `group` tiles, building it if needed.
+
+    The database is saved in the engines cache directory and memory-mapped.
+
+    """
+    filename = location(size, group)
+
+    if not os.path.exists(filename):
+        moves = build(size, group)
+        temporary = filename + '.tmp'
+        with open(temporary, 'wb') as writer:
+            writer.write(moves)
+        os.replace(temporary, filename)
+
+    with open(filename, 'rb') as reader:
+        return mmap.mmap(reader.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class Search:
+    """Shortest solution search that stops and resumes.
+
+    The IDA* search keeps its own stack of cells instead of recursing, so
+    `run` can return when its time is up and carry on from the same place
+    when called again.
+
+    The search also looks up the board's mirror image across the diagonal,
+    which is solved in the same number of moves, and uses the larger of the
+    two estimates.
+
+    >>> search = Search([1, 2, 3, 4, 5, 6, None, 7, 8])
+    >>> search.run(-1) is None
+    True
+    >>> search.run()
+    [7, 8]
+
+    """
+
+    def __init__(self, tiles):
+        size = int(len(tiles) ** 0.5)
+
+        if not solvable(tiles, size):
+            raise ValueError('board cannot be solved')
+
+        count = size * size
+        groups = patterns(size)
+        self.table = neighbors(size)
+        self.databases = [database(size, group) for group in groups]
+        self.flip = [
+            cell % size * size + cell // size for cell in range(count)
+        ]
+        places = {}
+
+        for number, group in enumerate(groups):
+            for place, tile in enumerate(group):
+                places[tile] = number, count**place
+
+        self.slots = [None]
+
+        for tile in range(1, count):
+            image = self.flip[tile - 1] + 1
+            self.slots.append(places[tile] + places[image])
+
+        self.board = [0 if tile is None else tile for tile in tiles]
+        self.indexes = [0] * len(groups)
+        self.images = [0] * len(groups)
+
+        for cell, tile in enumerate(self.board):
+            if tile:
+                number, weight, other, image_weight = self.slots[tile]
+                self.indexes[number] += cell * weight
+                self.images[other] += self.flip[cell] * image_weight
+
+        databases = self.databases
+        estimate = sum(
+            moves[index] for moves, index in zip(databases, self.indexes)
+        )
+        image_estimate = sum(
+            moves[index] for moves, index in zip(databases, self.images)
+        )
+        self.start = self.board.index(0), -1, 0, estimate, image_estimate
+        self.bound = max(estimate, image_estimate)
+        self.smallest = float('inf')
+        self.stack = [self.root()]
+        self.path = []
+        self.moves = [] if estimate == 0 else None
+
+    def root(self):
+        """Return stack frame of the starting board."""
+        blank = self.start[0]
+        return self.start + (iter(self.table[blank]),)
+
+    def run(self, budget=None):
+        """Return list of tiles to slide into the blank to solve the board,
+        or None if the search is not done after `budget` seconds.
+
+        """
+        if self.moves is not None:
+            return self.moves
+
+        deadline = (
+            float('inf') if budget is None else time.perf_counter() + budget
+        )
+        table = self.table
+        databases = self.databases
+        flip = self.flip
+        slots = self.slots
+        board = self.board
+        indexes = self.indexes
+        images = self.images
+        stack = self.stack
+        path = self.path
+        bound = self.bound
+        smallest = self.smallest
+        nodes = 0
+
+        while True:
+            blank, previous, cost, estimate, image_estimate, cells = stack[-1]
+            cell = next(cells, None)
+
+            if cell is None:
+                stack.pop()
+
+                if stack:
+                    tile = board[previous]
+                    number, weight, other, image_weight = slots[tile]
+                    indexes[number] += (blank - previous) * weight
+                    images[other] += (
+                        flip[blank] - flip[previous]
+                    ) * image_weight
+                    board[blank] = tile
+                    board[previous] = 0
+                    path.pop()
+                else:
+                    bound, smallest = smallest, float('inf')
+                    stack.append(self.root())
+
+                continue
+
+            if cell == previous:
+                continue
+
+            if not nodes % 1024 and time.perf_counter() > deadline:
+                self.bound, self.smallest = bound, smallest
+                return None
+
+            nodes += 1
+            tile = board[cell]
+            number, weight, other, image_weight = slots[tile]
+            moves = databases[number]
+            index = indexes[number]
+            moved = index + (blank - cell) * weight
+            image_moves = databases[other]
+            image = images[other]
+            image_moved = image + (flip[blank] - flip[cell]) * image_weight
+            change = moves[moved] - moves[index]
+            image_change = image_moves[image_moved] - image_moves[image]
+            total = (
+                cost
+                + 1
+                + max(estimate + change, image_estimate + image_change)
+            )
+
+            if total > bound:
+                if total < smallest:
+                    smallest = total
+                continue
+
+            board[blank] = tile
+            board[cell] = 0
+            indexes[number] = moved
+            images[other] = image_moved
+            path.append(tile)
+
+            if estimate + change == 0:
+                self.moves = path
+                return path
+
+            stack.append(
+                (
+                    cell,
+                    blank,
+                    cost + 1,
+                    estimate + change,
+                    image_estimate + image_change,
+                    iter(table[cell]),
+                )
+            )
+
+
+def solve(tiles, budget=None):
+    """Return list of tiles to slide into the blank to solve the board.
+
+    The list is as short as possible. Raise ValueError if the board cannot
+    be solved and Timeout if solving takes more than `budget` seconds.
+
+    >>> solve([1, 2, 3, 4, 5, 6, 7, None, 8])
+    [8]
+
+    """
+    moves = Search(tiles).run(budget)
+
+    if moves is None:
+        raise Timeout
+
+    return moves
+
+
+def main(args=None):
+    """Build pattern databases from command-line arguments."""
+    parser = argparse.ArgumentParser(description='Tiles pattern databases')
+    parser.add_argument('--size', type=int, default=4)
+    args = parser.parse_args(args)
+
+    for group in patterns(args.size):
+        database(args.size, group).close()
+        print('Built', location(args.size, group))
+
+
+if __name__ == '__main__':
+    main()
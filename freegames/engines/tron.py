@@ -0,0 +1,390 @@
+"""Tron engine, headless rules and bot tournaments.
+
+The arena matches the tron game: players move one step per tick inside a
+400x400 screen with steps of 4 pixels. Positions here are counted in steps so
+the arena spans -49 to 49 on both axes. A player crashes when it leaves the
+arena or runs into another player's trail.
+
+Run a tournament from the command-line::
+
+  $ python3 -m freegames.engines.tron results.csv --rounds 1000
+
+Results are written one line per match, as CSV or JSON Lines depending on the
+file extension, and Elo ratings are printed when all matches finish.
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import math
+import multiprocessing
+import os
+import random
+
+LIMIT = 2000
+SIZE = 99
+RATING = 1500
+
+
+def inside(head):
+    """Return True if head inside arena.
+
+    >>> inside((49, -49))
+    True
+    >>> inside((50, 0))
+    False
+
+    """
+    x, y = head
+    return -50 < x < 50 and -50 < y < 50
+
+
+def left(aim):
+    """Return aim turned left.
+
+    >>> left((1, 0))
+    (0, 1)
+
+    """
+    x, y = aim
+    return -y, x
+
+
+def right(aim):
+    """Return aim turned right.
+
+    >>> right((1, 0))
+    (0, -1)
+
+    """
+    x, y = aim
+    return y, -x
+
+
+def ahead(head, aim):
+    """Return next head moving along aim.
+
+    >>> ahead((0, 0), (0, -1))
+    (0, -1)
+
+    """
+    return head[0] + aim[0], head[1] + aim[1]
+
+
+def index(head):
+    """Return offset of head in arena cells.
+
+    >>> index((-49, -49))
+    0
+    >>> index((-49, -48))
+    1
+
+    """
+    x, y = head
+    return (x + 49) * SIZE + y + 49
+
+
+def start(player, count):
+    """Return head and aim of player when `count` players share the arena.
+
+    Players start evenly spaced on a circle and face the center.
+
+    >>> start(0, 2)
+    ((-25, 0), (1, 0))
+    >>> start(1, 2)
+    ((25, 0), (-1, 0))
+
+    """
+    angle = math.pi + 2 * math.pi * player / count
+    x = round(25 * math.cos(angle))
+    y = round(25 * math.sin(angle))
+
+    if abs(x) >= abs(y):
+        aim = (-1 if x > 0 else 1), 0
+    else:
+        aim = 0, (-1 if y > 0 else 1)
+
+    return (x, y), aim
+
+
+class Arena:
+    """Tron arena shared by `count` players.
+
+    Trails are stored once in a flat table of cells that records which player
+    owns each cell. Checking a move is a single lookup so a tick costs time
+    linear in the number of players, not in the number of trail pairs.
+
+    >>> arena = Arena(2)
+    >>> arena.step([(1, 0), (-1, 0)])
+    []
+    >>> arena.heads
+    [(-24, 0), (24, 0)]
+    >>> arena.heads = [(0, 0), (2, 0)]
+    >>> arena.step([(1, 0), (-1, 0)])
+    [0, 1]
+
+    """
+
+    def __init__(self, count=2):
+        assert 2 <= count <= 16, 'count must be from 2 to 16'
+        pairs = [start(player, count) for player in range(count)]
+        self.heads = [head for head, aim in pairs]
+        self.aims = [aim for head, aim in pairs]
+        self.alive = list(range(count))
+        self.cells = bytearray(SIZE * SIZE)
+        self.ticks = 0
+
+    def free(self, player, head):
+        """Return True if player can move to head."""
+        if not inside(head):
+            return False
+        owner = self.cells[index(head)]
+        return owner == 0 or owner == player + 1
+
+    def step(self, aims):
+        """Advance living players along aims and return list of crashed
+        players.
+
+        All moves are checked against the trails from before the tick so
+        results do not depend on player order. Players moving into the same
+        cell on the same tick all crash.
+
+        """
+        claims = {}
+
+        for player in self.alive:
+            aim = aims[player]
+            head = ahead(self.heads[player], aim)
+            self.aims[player] = aim
+            self.heads[player] = head
+            claims[head] = claims.get(head, 0) + 1
+
+        crashed = [
+            player
+            for player in self.alive
+            if claims[self.heads[player]] > 1
+            or not self.free(player, self.heads[player])
+        ]
+
+        gone = set(crashed)
+        self.alive = [player for player in self.alive if player not in gone]
+
+        for player in self.alive:
+            self.cells[index(self.heads[player])] = player + 1
+
+        self.ticks += 1
+        return crashed
+
+
+def straight(arena, player, rng):
+    """Bot that never turns."""
+    return arena.aims[player]
+
+
+def wander(arena, player, rng):
+    """Bot that turns at random."""
+    aim = arena.aims[player]
+    turn = rng.choice([left, right, None, None, None, None])
+    return aim if turn is None else turn(aim)
+
+
+def dodge(arena, player, rng):
+    """Bot that turns only to avoid a crash.
+
+    Cells other players could move into next are avoided when possible.
+
+    """
+    aim = arena.aims[player]
+    head = arena.heads[player]
+    turns = [left, right]
+    rng.shuffle(turns)
+    aims = [aim] + [turn(aim) for turn in turns]
+    danger = set()
+
+    for other in arena.alive:
+        if other != player:
+            spot, course = arena.heads[other], arena.aims[other]
+            for turn in [left, right]:
+                danger.add(ahead(spot, turn(course)))
+            danger.add(ahead(spot, course))
+
+    for aim in aims:
+        spot = ahead(head, aim)
+        if arena.free(player, spot) and spot not in danger:
+            return aim
+
+    for aim in aims:
+        if arena.free(player, ahead(head, aim)):
+            return aim
+
+    return aims[0]
+
+
+def greedy(arena, player, rng):
+    """Bot that heads for the longest free run."""
+    aim = arena.aims[player]
+    head = arena.heads[player]
+
+    def run(aim):
+        spot = ahead(head, aim)
+        count = 0
+        while count < 100 and arena.free(player, spot):
+            spot = ahead(spot, aim)
+            count += 1
+        return count
+
+    return max([aim, left(aim), right(aim)], key=run)
+
+
+bots = {
+    'straight': straight,
+    'wander': wander,
+    'dodge': dodge,
+    'greedy': greedy,
+}
+
+
+def play(task):
+    """Play match for task `(first, second, seed)` and return result.
+
+    The score is 1 if the first bot wins, 0 if the second bot wins, and 0.5
+    for a draw. Matches longer than `LIMIT` ticks are draws.
+
+    >>> result = play(('greedy', 'straight', 0))
+    >>> result['score']
+    1.0
+
+    """
+    first, second, seed = task
+    rng = random.Random(seed)
+    players = [bots[first], bots[second]]
+    arena = Arena(2)
+    crashed = []
+
+    while not crashed and arena.ticks < LIMIT:
+        aims = [bot(arena, player, rng) for player, bot in enumerate(players)]
+        crashed = arena.step(aims)
+
+    score = 0.5
+
+    if crashed == [0]:
+        score = 0.0
+    elif crashed == [1]:
+        score = 1.0
+
+    return {
+        'first': first,
+        'second': second,
+        'score': score,
+        'ticks': arena.ticks,
+        'seed': seed,
+    }
+
+
+def expected(rating, other):
+    """Return expected Elo score of rating against other.
+
+    >>> expected(1500, 1500)
+    0.5
+
+    """
+    return 1 / (1 + 10 ** ((other - rating) / 400))
+
+
+def update(ratings, result, factor=16):
+    """Update Elo ratings in-place with match result."""
+    first = result['first']
+    second = result['second']
+    rating = ratings.setdefault(first, RATING)
+    other = ratings.setdefault(second, RATING)
+    change = factor * (result['score'] - expected(rating, other))
+    ratings[first] += change
+    ratings[second] -= change
+
+
+def schedule(names, rounds, seed=0):
+    """Return match tasks where every bot plays every other bot `rounds` times
+    from each side.
+
+    >>> schedule(['dodge', 'greedy'], 1)
+    [('dodge', 'greedy', 0), ('greedy', 'dodge', 1)]
+
+    """
+    pairs = itertools.permutations(names, 2)
+    tasks = [pair for pair in pairs for count in range(rounds)]
+    return [task + (seed + index,) for index, task in enumerate(tasks)]
+
+
+def tournament(names, rounds, filename, workers=None, seed=0):
+    """Play tournament between bots `names` and return Elo ratings.
+
+    Matches are spread across `workers` processes (default one per core).
+    Results are written to `filename` as they finish: CSV if the name ends
+    with ".csv" and JSON Lines otherwise. Ratings are updated in schedule
+    order so they do not depend on which matches finish first.
+
+    """
+    tasks = schedule(names, rounds, seed)
+    workers = workers or os.cpu_count()
+    ratings = {name: RATING for name in names}
+    fields = ['first', 'second', 'score', 'ticks', 'seed']
+
+    with open(filename, 'w', buffering=1, newline='') as writer:
+        rows = csv.DictWriter(writer, fields)
+        table = filename.endswith('.csv')
+
+        if table:
+            rows.writeheader()
+
+        if workers == 1:
+            pool = None
+            results = map(play, tasks)
+        else:
+            pool = multiprocessing.Pool(workers)
+            size = max(1, len(tasks) // (workers * 8))
+            results = pool.imap_unordered(play, tasks, size)
+
+        pending = {}
+        turn = seed
+
+        try:
+            for result in results:
+                if table:
+                    rows.writerow(result)
+                else:
+                    writer.write(json.dumps(result) + '\n')
+
+                pending[result['seed']] = result
+
+                while turn in pending:
+                    update(ratings, pending.pop(turn))
+                    turn += 1
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+    return ratings
+
+
+def main(args=None):
+    """Run tournament from command-line arguments."""
+    parser = argparse.ArgumentParser(description='Tron bot tournament')
+    parser.add_argument('filename', help='results file (.csv or .jsonl)')
+    parser.add_argument('--bots', nargs='+', choices=sorted(bots))
+    parser.add_argument('--rounds', type=int, default=100)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(args)
+    names = args.bots or sorted(bots)
+    ratings = tournament(
+        names, args.rounds, args.filename, args.workers, args.seed
+    )
+
+    for name in sorted(ratings, key=ratings.get, reverse=True):
+        print('{:>10} {:7.1f}'.format(name, ratings[name]))
+
+
+if __name__ == '__main__':
+    main()
@@ -6,15 +6,19 @@ Exercises
 2. Vary the speed.
 3. Vary the size of the balls.
 4. Allow the bird to move forward and back.
+5. Press "a" for the autopilot. How far ahead does it look?
 """
 
 from random import *
 from turtle import *
 
 from freegames import vector
+from freegames.engines.flappy import Course, Pilot
 
 bird = vector(0, 0)
-balls = []
+state = {'auto': False}
+course = Course()
+pilot = Pilot()
 
 
 def tap(x, y):
@@ -23,6 +27,11 @@ def tap(x, y):
     bird.move(up)
 
 
+def auto():
+    """Toggle the autopilot."""
+    state['auto'] = not state['auto']
+
+
 def inside(point):
     """Return True if point on screen."""
     return -200 < point.x < 200 and -200 < point.y < 200
@@ -39,8 +48,8 @@ def draw(alive):
     else:
         dot(10, 'red')
 
-    for ball in balls:
-        goto(ball.x, ball.y)
+    for x, y in course:
+        goto(x, y)
         dot(20, 'black')
 
     update()
@@ -48,29 +57,26 @@ def draw(alive):
 
 def move():
     """Update object positions."""
+    course.advance()
     bird.y -= 5
 
-    for ball in balls:
-        ball.x -= 3
-
     if randrange(10) == 0:
         y = randrange(-199, 199)
-        ball = vector(199, y)
-        balls.append(ball)
-
-    while len(balls) > 0 and not inside(balls[0]):
-        balls.pop(0)
+        course.spawn(y)
 
     if not inside(bird):
         draw(False)
         return
 
-    for ball in balls:
-        if abs(ball - bird) < 15:
-            draw(False)
-            return
+    if course.hit(bird.x, bird.y):
+        draw(False)
+        return
 
     draw(True)
+
+    if state['auto'] and pilot.tap(course, bird.x, bird.y):
+        tap(bird.x, bird.y)
+
     ontimer(move, 50)
 
 
@@ -79,5 +85,7 @@ hideturtle()
 up()
 tracer(False)
 onscreenclick(tap)
+listen()
+onkey(auto, 'a')
 move()
 done()
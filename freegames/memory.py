@@ -3,89 +3,112 @@
 Exercises:
 
 1. Count and print how many taps occur.
-2. Decrease the number of tiles to a 4x4 grid.
+2. Decrease the number of tiles to a 4x4 grid by changing `columns` and
+   `rows`.
 3. Detect when all tiles are revealed.
 4. Center single-digit tile.
 5. Use letters instead of tiles.
+6. Use your own GIF image by changing `image`.
 """
 
 from random import *
 from turtle import *
 
 from freegames import path
-
-car = path('car.gif')
-tiles = list(range(32)) * 2
+from freegames.engines.atlas import dimensions, slices
+
+image = path('car.gif')
+columns = 8
+rows = 8
+image_width, image_height = dimensions(image)
+wide = image_width // columns
+tall = image_height // rows
+origin_x = -columns * wide // 2
+origin_y = -rows * tall // 2
+tiles = list(range(columns * rows // 2)) * 2
 state = {'mark': None}
-hide = [True] * 64
-
-
-def square(x, y):
-    """Draw white square with black outline at (x, y)."""
-    up()
-    goto(x, y)
-    down()
-    color('black', 'white')
-    begin_fill()
-    for count in range(4):
-        forward(50)
-        left(90)
-    end_fill()
+hide = [True] * (columns * rows)
+writer = Turtle(visible=False)
 
 
 def index(x, y):
     """Convert (x, y) coordinates to tiles index."""
-    return int((x + 200) // 50 + ((y + 200) // 50) * 8)
+    return int((x - origin_x) // wide + ((y - origin_y) // tall) * columns)
 
 
 def xy(count):
     """Convert tiles count to (x, y) coordinates."""
-    return (count % 8) * 50 - 200, (count // 8) * 50 - 200
+    x = (count % columns) * wide + origin_x
+    y = (count // columns) * tall + origin_y
+    return x, y
+
+
+def register():
+    """Register every image piece as a shape once, before any reveal."""
+    for piece in pieces:
+        addshape(piece)
+
+
+def reveal(count):
+    """Stamp the image piece over tile `count` if it is hidden."""
+    if hide[count]:
+        hide[count] = False
+        x, y = xy(count)
+        goto(x + wide / 2, y + tall / 2)
+        shape(pieces[count])
+        stamp()
+
+
+def number():
+    """Write number of the marked tile if it is hidden."""
+    writer.clear()
+    mark = state['mark']
+
+    if mark is not None and hide[mark]:
+        x, y = xy(mark)
+        writer.up()
+        writer.goto(x + 2, y)
+        writer.color('black')
+        writer.write(tiles[mark], font=('Arial', tall * 3 // 5, 'normal'))
 
 
 def tap(x, y):
-    """Update mark and hidden tiles based on tap."""
+    """Update mark and hidden tiles based on tap and redraw them."""
     spot = index(x, y)
     mark = state['mark']
 
     if mark is None or mark == spot or tiles[mark] != tiles[spot]:
         state['mark'] = spot
     else:
-        hide[spot] = False
-        hide[mark] = False
+        reveal(spot)
+        reveal(mark)
         state['mark'] = None
 
+    number()
+    update()
 
-def draw():
-    """Draw image and tiles."""
-    clear()
-    goto(0, 0)
-    shape(car)
-    stamp()
-
-    for count in range(64):
-        if hide[count]:
-            x, y = xy(count)
-            square(x, y)
 
-    mark = state['mark']
+def draw():
+    """Draw white squares with black outlines over every tile."""
+    up()
+    shape('square')
+    shapesize(tall / 20, wide / 20)
+    color('black', 'white')
 
-    if mark is not None and hide[mark]:
-        x, y = xy(mark)
-        up()
-        goto(x + 2, y)
-        color('black')
-        write(tiles[mark], font=('Arial', 30, 'normal'))
+    for count in range(columns * rows):
+        x, y = xy(count)
+        goto(x + wide / 2, y + tall / 2)
+        stamp()
 
     update()
-    ontimer(draw, 100)
 
 
 shuffle(tiles)
-setup(420, 420, 370, 0)
-addshape(car)
+setup(columns * wide + 20, rows * tall + 20, 370, 0)
 hideturtle()
 tracer(False)
+pieces = slices(image, columns, rows)
+register()
 onscreenclick(tap)
 draw()
 done()
@@ -5,39 +5,38 @@ Exercises
 1. What does the `seed(0)` function call do?
 2. Change the number of bombs on the grid.
 3. Change the size of the grid.
+4. Use the arrow keys to scroll around a big grid.
+5. Press "h" for a hint. How does the solver find safe cells?
+6. Press "i" to play on an infinite grid.
 """
 
-from random import randrange, seed
+from random import seed
 from turtle import *
 
-from freegames import floor, square
+from freegames import square
+from freegames.engines.minesolver import Solver
+from freegames.engines.minesweeper import Board, InfiniteBoard
 
 seed(0)
-bombs = {}
-shown = {}
-counts = {}
+board = Board(columns=8, rows=8, mines=8)
+state = {'board': board, 'solver': Solver(board), 'column': 0, 'row': 0}
 
 
-def initialize():
-    """Initialize `bombs`, `counts`, and `shown` grids."""
-    for x in range(-250, 250, 50):
-        for y in range(-250, 250, 50):
-            bombs[x, y] = False
-            shown[x, y] = False
-            counts[x, y] = -1
+def visible():
+    """Return list of (x, y, index) for cells shown on screen."""
+    board = state['board']
+    board.focus(state['column'], state['row'], 8, 8)
+    cells = []
 
-    for count in range(8):
-        x = randrange(-200, 200, 50)
-        y = randrange(-200, 200, 50)
-        bombs[x, y] = True
+    for column in range(8):
+        for row in range(8):
+            spot = state['column'] + column, state['row'] + row
+            if board.inside(*spot):
+                x = column * 50 - 200
+                y = row * 50 - 200
+                cells.append((x, y, board.cell(*spot)))
 
-    for x in range(-200, 200, 50):
-        for y in range(-200, 200, 50):
-            total = 0
-            for i in (-50, 0, 50):
-                for j in (-50, 0, 50):
-                    total += bombs[x + i, y + j]
-            counts[x, y] = total
+    return cells
 
 
 def stamp(x, y, text):
@@ -48,48 +47,107 @@ def stamp(x, y, text):
 
 
 def draw():
-    """Draw the initial board grid."""
-    for x in range(-200, 200, 50):
-        for y in range(-200, 200, 50):
+    """Draw the visible part of the board grid."""
+    board = state['board']
+
+    for x, y, index in visible():
+        if board.shown[index]:
+            stamp(x, y, board.counts[index])
+        else:
             stamp(x, y, '?')
 
+    update()
+
 
 def end():
-    """Draw the bombs as X's on the grid."""
-    for x in range(-200, 200, 50):
-        for y in range(-200, 200, 50):
-            if bombs[x, y]:
-                stamp(x, y, 'X')
+    """Draw the visible bombs as X's on the grid."""
+    board = state['board']
+
+    for x, y, index in visible():
+        if board.mines[index]:
+            stamp(x, y, 'X')
+
+    update()
+
+
+def scroll(columns, rows):
+    """Move the view by `columns` and `rows` and redraw the grid."""
+    board = state['board']
+    column = state['column'] + columns
+    row = state['row'] + rows
+
+    if board.inside(column, row) and board.inside(column + 7, row + 7):
+        state['column'] = column
+        state['row'] = row
+
+    draw()
+
+
+def show(index):
+    """Reveal cell `index` and draw newly revealed cells on screen."""
+    board = state['board']
+    spots = board.reveal(index)
+    state['solver'].update(spots)
+
+    for index in spots:
+        column, row = board.position(index)
+        column -= state['column']
+        row -= state['row']
+
+        if 0 <= column < 8 and 0 <= row < 8:
+            stamp(column * 50 - 200, row * 50 - 200, board.counts[index])
+
+    update()
+
+
+def hint():
+    """Reveal a cell the solver proves is safe, on screen if possible."""
+    safe, mines = state['solver'].solve()
+    spots = [index for x, y, index in visible() if index in safe]
+    spots += sorted(safe)
+
+    if spots:
+        show(spots[0])
 
 
 def tap(x, y):
     """Respond to screen click at `x` and `y` coordinates."""
-    x = floor(x, 50)
-    y = floor(y, 50)
+    board = state['board']
+    column = int((x + 200) // 50)
+    row = int((y + 200) // 50)
+
+    if not (0 <= column < 8 and 0 <= row < 8):
+        return
+
+    index = board.cell(state['column'] + column, state['row'] + row)
 
-    if bombs[x, y]:
+    if board.mines[index]:
         end()
         return
 
-    pairs = [(x, y)]
+    show(index)
 
-    while pairs:
-        x, y = pairs.pop()
-        stamp(x, y, counts[x, y])
-        shown[x, y] = True
 
-        if counts[x, y] == 0:
-            for i in (-50, 0, 50):
-                for j in (-50, 0, 50):
-                    pair = x + i, y + j
-                    if not shown[pair]:
-                        pairs.append(pair)
+def endless():
+    """Start a new game on an infinite board centered on the screen."""
+    board = InfiniteBoard(seed=0)
+    state['board'] = board
+    state['solver'] = Solver(board)
+    state['column'] = -4
+    state['row'] = -4
+    draw()
 
 
 setup(420, 420, 370, 0)
 hideturtle()
 tracer(False)
-initialize()
 draw()
+listen()
+onkey(lambda: scroll(-1, 0), 'Left')
+onkey(lambda: scroll(1, 0), 'Right')
+onkey(lambda: scroll(0, 1), 'Up')
+onkey(lambda: scroll(0, -1), 'Down')
+onkey(hint, 'h')
+onkey(endless, 'i')
 onscreenclick(tap)
 done()
@@ -12,7 +12,7 @@ Exercises
 from random import choice
 from turtle import *
 
-from freegames import floor, vector
+from freegames import SpatialHash, floor, vector
 
 state = {'score': 0}
 path = Turtle(visible=False)
@@ -25,6 +25,7 @@ ghosts = [
     [vector(100, 160), vector(0, -5)],
     [vector(100, -160), vector(-5, 0)],
 ]
+grid = SpatialHash(40)
 # fmt: off
 tiles = [
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
@@ -107,6 +108,12 @@ def world():
                 path.dot(2, 'white')
 
 
+def track():
+    """Insert every ghost in the spatial hash, keyed by its index."""
+    for index, (point, course) in enumerate(ghosts):
+        grid.insert(index, point.x, point.y)
+
+
 def move():
     """Move pacman and all ghosts."""
     writer.undo()
@@ -130,7 +137,7 @@ def move():
     goto(pacman.x + 10, pacman.y + 10)
     dot(20, 'yellow')
 
-    for point, course in ghosts:
+    for index, (point, course) in enumerate(ghosts):
         if valid(point + course):
             point.move(course)
         else:
@@ -144,15 +151,15 @@ def move():
             course.x = plan.x
             course.y = plan.y
 
+        grid.move(index, point.x, point.y)
         up()
         goto(point.x + 10, point.y + 10)
         dot(20, 'red')
 
     update()
 
-    for point, course in ghosts:
-        if abs(pacman - point) < 20:
-            return
+    if grid.query(pacman.x, pacman.y, 20):
+        return
 
     ontimer(move, 100)
 
@@ -175,6 +182,7 @@ onkey(lambda: change(5, 0), 'Right')
 onkey(lambda: change(-5, 0), 'Left')
 onkey(lambda: change(0, 5), 'Up')
 onkey(lambda: change(0, -5), 'Down')
+track()
 world()
 move()
 done()
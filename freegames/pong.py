@@ -8,13 +8,14 @@ Exercises
 4. Change the size of the paddles.
 5. Change how the ball bounces off walls.
 6. How would you add a computer player?
-6. Add a second ball.
+7. Press "b" to serve another ball. How many can you keep in play?
+8. Press "a" to let the computer play the right paddle.
 """
 
 from random import choice, random
 from turtle import *
 
-from freegames import vector
+from freegames.engines.pong import RIGHT, Court, intercept
 
 
 def value():
@@ -22,9 +23,14 @@ def value():
     return (3 + random() * 2) * choice([1, -1])
 
 
-ball = vector(0, 0)
-aim = vector(value(), value())
+court = Court()
 state = {1: 0, 2: 0}
+plan = {'auto': False, 'aim': None, 'y': -25}
+
+
+def serve():
+    """Serve a ball from the middle."""
+    court.serve(0, 0, value(), value())
 
 
 def move(player, change):
@@ -32,6 +38,40 @@ def move(player, change):
     state[player] += change
 
 
+def auto():
+    """Toggle the computer player on the right paddle."""
+    plan['auto'] = not plan['auto']
+
+
+def follow():
+    """Move right paddle toward where the next ball will cross it.
+
+    The crossing is only predicted again when that ball's aim changes.
+
+    """
+    balls = court.balls
+    coming = [
+        ((RIGHT - x) / dx, index)
+        for index, (x, dx) in enumerate(zip(balls.xs, balls.dxs))
+        if dx > 0
+    ]
+
+    if coming:
+        time, index = min(coming)
+        x, y = balls.xs[index], balls.ys[index]
+        dx, dy = balls.dxs[index], balls.dys[index]
+        if plan['aim'] != (dx, dy):
+            plan['aim'] = dx, dy
+            time, y = intercept(x, y, dx, dy, RIGHT)
+            plan['y'] = y - 25
+    else:
+        plan['aim'] = None
+        plan['y'] = -25
+
+    change = plan['y'] - state[2]
+    move(2, max(-10, min(10, change)))
+
+
 def rectangle(x, y, width, height):
     """Draw rectangle at (x, y) with given width and height."""
     up()
@@ -48,39 +88,25 @@ def rectangle(x, y, width, height):
 
 def draw():
     """Draw game and move pong ball."""
+    if plan['auto']:
+        follow()
+
     clear()
     rectangle(-200, state[1], 10, 50)
     rectangle(190, state[2], 10, 50)
 
-    ball.move(aim)
-    x = ball.x
-    y = ball.y
-
+    court.step(state[1], state[2])
+    balls = court.balls
     up()
-    goto(x, y)
-    dot(10)
-    update()
-
-    if y < -200 or y > 200:
-        aim.y = -aim.y
 
-    if x < -185:
-        low = state[1]
-        high = state[1] + 50
+    for x, y in zip(balls.xs, balls.ys):
+        goto(x, y)
+        dot(10)
 
-        if low <= y <= high:
-            aim.x = -aim.x
-        else:
-            return
-
-    if x > 185:
-        low = state[2]
-        high = state[2] + 50
+    update()
 
-        if low <= y <= high:
-            aim.x = -aim.x
-        else:
-            return
+    if not balls:
+        return
 
     ontimer(draw, 50)
 
@@ -93,5 +119,8 @@ onkey(lambda: move(1, 20), 'w')
 onkey(lambda: move(1, -20), 's')
 onkey(lambda: move(2, 20), 'i')
 onkey(lambda: move(2, -20), 'k')
+onkey(auto, 'a')
+onkey(serve, 'b')
+serve()
 draw()
 done()
@@ -2,77 +2,179 @@
 
 Exercises
 
-1. Speed up tile flash rate.
-2. Add more tiles.
+1. Change how fast tiles flash and speed up.
+2. Add more tiles by changing `columns` and `rows`.
 """
 
-from random import choice
-from time import sleep
+from collections import deque
+from random import randrange
 from turtle import *
 
-from freegames import floor, square, vector
+from freegames import square
 
-pattern = []
-guesses = []
-tiles = {
-    vector(0, 0): ('red', 'dark red'),
-    vector(0, -200): ('blue', 'dark blue'),
-    vector(-200, 0): ('green', 'dark green'),
-    vector(-200, -200): ('yellow', 'khaki'),
-}
+columns = 2
+rows = 2
+cell = 10
+palette = [
+    ('yellow', 'khaki'),
+    ('blue', 'dark blue'),
+    ('green', 'dark green'),
+    ('red', 'dark red'),
+    ('orange', 'saddle brown'),
+    ('cyan', 'dark cyan'),
+    ('magenta', 'dark magenta'),
+    ('violet', 'dark violet'),
+    ('gray', 'dim gray'),
+]
+cells = 400 // cell
+delay = 500
+fastest = 100
+decay = 0.9
+pattern = bytearray()
+queue = deque()
+state = {'busy': False, 'playing': False, 'step': 0, 'guessed': 0}
+
+
+def layout(columns, rows):
+    """Return tile size and list of tile corners for `columns` by `rows`
+    grid.
+
+    Corners are snapped to multiples of `cell` so every tile covers whole
+    cells of the hit-test table. Tile ids are bytes and 255 means no tile, so
+    at most 255 tiles fit.
+
+    """
+    assert columns * rows <= 255, 'at most 255 tiles fit'
+    size = 400 // max(columns, rows) // cell * cell
+    origin_x = -columns * size // 2 // cell * cell
+    origin_y = -rows * size // 2 // cell * cell
+    spots = [
+        (origin_x + tile % columns * size, origin_y + tile // columns * size)
+        for tile in range(columns * rows)
+    ]
+    return size, spots
+
+
+def table(size, spots):
+    """Return hit-test table of tile ids for each `cell` square of screen.
+
+    Cells are listed row by row from the bottom left and cells outside every
+    tile hold 255.
+
+    """
+    lookup = bytearray([255]) * (cells * cells)
+    span = size // cell
+
+    for tile, (x, y) in enumerate(spots):
+        first = (y + 200) // cell
+        for row in range(first, first + span):
+            start = row * cells + (x + 200) // cell
+            stop = start + span
+            lookup[start:stop] = bytes([tile]) * span
+
+    return lookup
+
+
+def find(lookup, x, y):
+    """Return id of tile at (x, y) in hit-test table or 255 if none."""
+    column = int((x + 200) // cell)
+    row = int((y + 200) // cell)
+
+    if 0 <= column < cells and 0 <= row < cells:
+        return lookup[row * cells + column]
+
+    return 255
+
+
+size, spots = layout(columns, rows)
+lookup = table(size, spots)
 
 
 def grid():
     """Draw grid of tiles."""
-    square(0, 0, 200, 'dark red')
-    square(0, -200, 200, 'dark blue')
-    square(-200, 0, 200, 'dark green')
-    square(-200, -200, 200, 'khaki')
+    for tile, (x, y) in enumerate(spots):
+        glow, dark = palette[tile % len(palette)]
+        square(x, y, size, dark)
+
     update()
 
 
-def flash(tile):
-    """Flash tile in grid."""
-    glow, dark = tiles[tile]
-    square(tile.x, tile.y, 200, glow)
-    update()
-    sleep(0.5)
-    square(tile.x, tile.y, 200, dark)
+def pace():
+    """Return milliseconds a tile stays lit or dark, shorter as the pattern
+    grows.
+
+    """
+    return max(fastest, int(delay * decay ** len(pattern)))
+
+
+def run():
+    """Paint next color of queued flashes or the pattern and wait before
+    painting the one after.
+
+    """
+    step = state['step']
+
+    if queue:
+        tile, lit = queue.popleft()
+    elif step < 2 * len(pattern):
+        tile = pattern[step // 2]
+        lit = step % 2 == 0
+        state['step'] += 1
+    else:
+        state['busy'] = False
+        state['playing'] = False
+        return
+
+    state['busy'] = True
+    glow, dark = palette[tile % len(palette)]
+    x, y = spots[tile]
+    square(x, y, size, glow if lit else dark)
     update()
-    sleep(0.5)
+    ontimer(run, pace())
 
 
-def grow():
-    """Grow pattern and flash tiles."""
-    tile = choice(list(tiles))
-    pattern.append(tile)
+def wake():
+    """Start painting unless already busy."""
+    if not state['busy']:
+        run()
 
-    for tile in pattern:
-        flash(tile)
 
+def flash(tile):
+    """Flash tile in grid without blocking taps."""
+    queue.append((tile, True))
+    queue.append((tile, False))
+    wake()
+
+
+def grow():
+    """Grow pattern and play it back."""
+    pattern.append(randrange(len(spots)))
+    state['step'] = 0
+    state['playing'] = True
+    state['guessed'] = 0
+    wake()
     print('Pattern length:', len(pattern))
-    guesses.clear()
 
 
 def tap(x, y):
-    """Respond to screen tap."""
-    onscreenclick(None)
-    x = floor(x, 200)
-    y = floor(y, 200)
-    tile = vector(x, y)
-    index = len(guesses)
-
-    if tile != pattern[index]:
+    """Respond to screen tap, ignored while the pattern plays."""
+    if state['playing']:
+        return
+
+    tile = find(lookup, x, y)
+
+    if tile == 255:
+        return
+
+    if tile != pattern[state['guessed']]:
         exit()
 
-    guesses.append(tile)
+    state['guessed'] += 1
     flash(tile)
 
-    if len(guesses) == len(pattern):
+    if state['guessed'] == len(pattern):
         grow()
 
-    onscreenclick(tap)
-
 
 def start(x, y):
     """Start game."""
@@ -4,13 +4,14 @@ Exercises
 
 1. Give the X and O a different color and width.
 2. What happens when someone taps a taken spot?
-3. How would you detect when someone has won?
-4. How could you create a computer player?
+3. How does the board detect when someone has won?
+4. How does the computer player choose a move?
 """
 
 from turtle import *
 
 from freegames import line
+from freegames.engines.tictactoe import Board, Player
 
 
 def grid():
@@ -35,24 +36,38 @@ def drawo(x, y):
     circle(62)
 
 
-def floor(value):
-    """Round value down to grid with square size 133."""
-    return ((value + 200) // 133) * 133 - 200
+board = Board()
+computer = Player()
+players = [drawx, drawo]
 
 
-state = {'player': 0}
-players = [drawx, drawo]
+def mark(cell):
+    """Play and draw X or O in `cell` and return True if the game is over."""
+    name = 'XO'[board.player]
+    draw = players[board.player]
+    board.play(cell)
+    draw(cell % 3 * 133 - 200, cell // 3 * 133 - 200)
+    update()
+
+    if board.won():
+        print(name, 'wins!')
+    elif board.full():
+        print('Draw!')
+
+    return board.won() or board.full()
 
 
 def tap(x, y):
-    """Draw X or O in tapped square."""
-    x = floor(x)
-    y = floor(y)
-    player = state['player']
-    draw = players[player]
-    draw(x, y)
-    update()
-    state['player'] = not player
+    """Draw X in tapped square and let the computer reply with O."""
+    column = int((x + 200) // 133)
+    row = int((y + 200) // 133)
+    cell = column + row * 3
+
+    if board.won() or not (0 <= column < 3 and 0 <= row < 3):
+        return
+
+    if board.playable(cell) and not mark(cell):
+        mark(computer.move(board))
 
 
 setup(420, 420, 370, 0)
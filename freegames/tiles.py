@@ -5,95 +5,162 @@ Exercises
 1. Track a score by the number of tile moves.
 2. Permit diagonal squares as neighbors.
 3. Respond to arrow keys instead of mouse clicks.
-4. Make the grid bigger.
+4. Make the grid bigger by changing `size`.
+5. Press "h" for a hint. How long does the solver take on a 5x5 grid?
 """
 
-from random import *
 from turtle import *
 
-from freegames import floor, vector
-
-tiles = {}
-neighbors = [
-    vector(100, 0),
-    vector(-100, 0),
-    vector(0, 100),
-    vector(0, -100),
-]
-
-
-def load():
-    """Load tiles and scramble."""
-    count = 1
-
-    for y in range(-200, 200, 100):
-        for x in range(-200, 200, 100):
-            mark = vector(x, y)
-            tiles[mark] = count
-            count += 1
-
-    tiles[mark] = None
-
-    for count in range(1000):
-        neighbor = choice(neighbors)
-        spot = mark + neighbor
-
-        if spot in tiles:
-            number = tiles[spot]
-            tiles[spot] = None
-            tiles[mark] = number
-            mark = spot
-
-
-def square(mark, number):
-    """Draw white square with black outline and number."""
+from freegames.engines.tiles import (
+    Search,
+    distance,
+    neighbors,
+    ready,
+    scramble,
+    solved,
+)
+
+size = 4
+budget = 10
+burst = 0.05
+scale = 400 // size
+tiles = scramble(size)
+spots = neighbors(size)
+state = {'blank': tiles.index(None), 'moved': None}
+hints = {'tiles': None, 'moves': [], 'search': None, 'spent': 0}
+
+
+def square(index):
+    """Draw white square with black outline and number for cell `index`."""
+    number = tiles[index]
     up()
-    goto(mark.x, mark.y)
+    goto(index % size * scale - 200, index // size * scale - 200)
     down()
 
     color('black', 'white')
     begin_fill()
     for count in range(4):
-        forward(99)
+        forward(scale - 1)
         left(90)
     end_fill()
 
     if number is None:
         return
     elif number < 10:
-        forward(20)
+        forward(scale // 5)
 
-    write(number, font=('Arial', 60, 'normal'))
+    write(number, font=('Arial', scale * 3 // 5, 'normal'))
+
+
+def slide(index):
+    """Slide tile at cell `index` into the blank if they are neighbors."""
+    blank = state['blank']
+
+    if blank in spots[index]:
+        tiles[blank] = tiles[index]
+        tiles[index] = None
+        state['blank'] = index
+        state['moved'] = blank
+        square(blank)
+        square(index)
 
 
 def tap(x, y):
     """Swap tile and empty square."""
-    x = floor(x, 100)
-    y = floor(y, 100)
-    mark = vector(x, y)
+    column = int((x + 200) // scale)
+    row = int((y + 200) // scale)
+
+    if 0 <= column < size and 0 <= row < size:
+        slide(column + row * size)
+
+
+def nearer():
+    """Return cell of the neighbor tile that slides closest to its place.
+
+    The tile that just moved is never slid straight back.
+
+    """
+    blank = state['blank']
+    cells = [cell for cell in spots[blank] if cell != state['moved']]
+
+    def cost(index):
+        tiles[blank], tiles[index] = tiles[index], None
+        total = distance(tiles, size)
+        tiles[index], tiles[blank] = tiles[blank], None
+        return total
+
+    return min(cells, key=cost)
+
+
+def think():
+    """Run the solver for a slice of time, then hint once it is done."""
+    if tiles != hints['tiles']:
+        hints['search'] = None
+        return
+
+    moves = hints['search'].run(burst)
+    hints['spent'] += burst
+
+    if moves is None and hints['spent'] < budget:
+        ontimer(think, 10)
+        return
+
+    if moves is None:
+        print('No shortest solution found in', budget, 'seconds')
+
+    hints['moves'] = list(moves or [])
+    hints['search'] = None
+    hint()
+
+
+def hint():
+    """Slide the next tile of a shortest solution.
+
+    The solver runs a slice at a time between frames. Without pattern
+    databases, or when no solution is found within `budget` seconds, slide
+    the neighbor tile that gets closest to its place until the board is
+    changed by hand.
+
+    """
+    if tiles != hints['tiles']:
+        running = hints['search'] is not None
+        hints['tiles'] = list(tiles)
+        hints['moves'] = []
+        hints['search'] = None
+
+        if ready(size):
+            hints['search'] = Search(tiles)
+            hints['spent'] = 0
+            if not running:
+                think()
+            return
+
+        print('Build hints with: python3 -m freegames.engines.tiles')
+
+    if hints['search'] is not None:
+        return
 
-    for neighbor in neighbors:
-        spot = mark + neighbor
+    if hints['moves']:
+        slide(tiles.index(hints['moves'].pop(0)))
+    elif tiles != solved(size):
+        slide(nearer())
 
-        if spot in tiles and tiles[spot] is None:
-            number = tiles[mark]
-            tiles[spot] = number
-            square(spot, number)
-            tiles[mark] = None
-            square(mark, None)
+    hints['tiles'] = list(tiles)
 
 
 def draw():
     """Draw all tiles."""
-    for mark in tiles:
-        square(mark, tiles[mark])
+    for index in range(len(tiles)):
+        square(index)
     update()
 
 
 setup(420, 420, 370, 0)
 hideturtle()
 tracer(False)
-load()
+print('Solve in at least', distance(tiles, size), 'moves')
 draw()
+listen()
+onkey(hint, 'h')
 onscreenclick(tap)
 done()
@@ -6,47 +6,36 @@ Exercises
 2. Stop a tron player from running into itself.
 3. Allow the tron player to go around the edge of the screen.
 4. How would you create a computer player?
+5. Add more players. Up to 16 players can share the arena.
 """
 
 from turtle import *
 
-from freegames import square, vector
+from freegames import square
+from freegames.engines.tron import Arena, left, right
 
-p1xy = vector(-100, 0)
-p1aim = vector(4, 0)
-p1body = set()
+players = [('red', 'a', 'd'), ('blue', 'j', 'l')]
+arena = Arena(len(players))
 
-p2xy = vector(100, 0)
-p2aim = vector(-4, 0)
-p2body = set()
 
-
-def inside(head):
-    """Return True if head inside screen."""
-    return -200 < head.x < 200 and -200 < head.y < 200
+def turn(player, change):
+    """Change player aim by turning left or right."""
+    arena.aims[player] = change(arena.aims[player])
 
 
 def draw():
     """Advance players and draw game."""
-    p1xy.move(p1aim)
-    p1head = p1xy.copy()
-
-    p2xy.move(p2aim)
-    p2head = p2xy.copy()
-
-    if not inside(p1head) or p1head in p2body:
-        print('Player blue wins!')
-        return
+    arena.step(arena.aims)
 
-    if not inside(p2head) or p2head in p1body:
-        print('Player red wins!')
+    if len(arena.alive) < 2:
+        for player in arena.alive:
+            print('Player', players[player][0], 'wins!')
         return
 
-    p1body.add(p1head)
-    p2body.add(p2head)
+    for player in arena.alive:
+        x, y = arena.heads[player]
+        square(x * 4, y * 4, 3, players[player][0])
 
-    square(p1xy.x, p1xy.y, 3, 'red')
-    square(p2xy.x, p2xy.y, 3, 'blue')
     update()
     ontimer(draw, 50)
 
@@ -55,9 +44,8 @@ setup(420, 420, 370, 0)
 hideturtle()
 tracer(False)
 listen()
-onkey(lambda: p1aim.rotate(90), 'a')
-onkey(lambda: p1aim.rotate(-90), 'd')
-onkey(lambda: p2aim.rotate(90), 'j')
-onkey(lambda: p2aim.rotate(-90), 'l')
+for player, (name, turn_left, turn_right) in enumerate(players):
+    onkey(lambda player=player: turn(player, left), turn_left)
+    onkey(lambda player=player: turn(player, right), turn_right)
 draw()
 done()
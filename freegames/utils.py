@@ -4,6 +4,7 @@
 
 import collections.abc
 import math
+import operator
 import os
 
 
@@ -473,3 +474,127 @@ class vector(collections.abc.Sequence):
         type_self = type(self)
         name = type_self.__name__
         return '{}({!r}, {!r})'.format(name, self.x, self.y)
+
+
+class SpatialHash:
+    """Spatial hash of points bucketed by square cells of `size`.
+
+    Points are stored under hashable keys. Radius queries only look at the
+    cells overlapping the circle, so finding nearby points takes time
+    proportional to the points near the circle rather than all points. Cells
+    twice the usual query radius work well.
+
+    >>> grid = SpatialHash(20)
+    >>> grid.insert('a', 0, 0)
+    >>> grid.insert('b', 50, 0)
+    >>> grid.query(10, 0, 15)
+    ['a']
+    >>> grid.move('b', 20, 0)
+    >>> sorted(grid.query(10, 0, 15))
+    ['a', 'b']
+    >>> grid.remove('a')
+    >>> grid.query(10, 0, 15)
+    ['b']
+    >>> len(grid), 'a' in grid, grid['b']
+    (1, False, (20, 0))
+
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.cells = {}
+        self.points = {}
+
+    def __len__(self):
+        return len(self.points)
+
+    def __contains__(self, key):
+        return key in self.points
+
+    def __getitem__(self, key):
+        """Return (x, y) position of point `key`."""
+        x, y, cell = self.points[key]
+        return x, y
+
+    def cell(self, x, y):
+        """Return (column, row) of cell containing (x, y).
+
+        >>> SpatialHash(10).cell(-5, 25)
+        (-1, 2)
+
+        """
+        size = self.size
+        return int(x // size), int(y // size)
+
+    def insert(self, key, x, y):
+        """Insert point `key` at (x, y), or move it there if already present.
+
+        >>> grid = SpatialHash(10)
+        >>> grid.insert('a', 0, 0)
+        >>> grid.insert('a', 50, 0)
+        >>> grid.query(0, 0, 5), grid.query(50, 0, 5), len(grid.cells)
+        ([], ['a'], 1)
+
+        """
+        if key in self.points:
+            self.move(key, x, y)
+            return
+
+        cell = self.cell(x, y)
+        self.points[key] = x, y, cell
+        self.cells.setdefault(cell, set()).add(key)
+
+    def remove(self, key):
+        """Remove point `key`."""
+        x, y, cell = self.points.pop(key)
+        bucket = self.cells[cell]
+        bucket.discard(key)
+        if not bucket:
+            del self.cells[cell]
+
+    def move(self, key, x, y):
+        """Move point `key` to (x, y).
+
+        Buckets only change when the point crosses into another cell.
+
+        """
+        old = self.points[key][2]
+        cell = self.cell(x, y)
+        self.points[key] = x, y, cell
+
+        if cell != old:
+            bucket = self.cells[old]
+            bucket.discard(key)
+            if not bucket:
+                del self.cells[old]
+            self.cells.setdefault(cell, set()).add(key)
+
+    def query(self, x, y, radius, closed=False):
+        """Return list of keys of points less than `radius` from (x, y).
+
+        With `closed` points exactly `radius` away are included too.
+
+        >>> grid = SpatialHash(10)
+        >>> grid.insert('a', 3, 4)
+        >>> grid.query(0, 0, 5), grid.query(0, 0, 5, closed=True)
+        ([], ['a'])
+
+        """
+        within = operator.le if closed else operator.lt
+        left, bottom = self.cell(x - radius, y - radius)
+        right, top = self.cell(x + radius, y + radius)
+        cells = self.cells
+        points = self.points
+        limit = radius * radius
+        found = []
+
+        for column in range(left, right + 1):
+            for row in range(bottom, top + 1):
+                for key in cells.get((column, row), ()):
+                    px, py, cell = points[key]
+                    dx = px - x
+                    dy = py - y
+                    if within(dx * dx + dy * dy, limit):
+                        found.append(key)
+
+        return found
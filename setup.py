@@ -34,7 +34,7 @@ st.setup(
     author_email='contact@grantjenks.com',
     url='http://www.grantjenks.com/docs/freegames/',
     license='Apache 2.0',
-    packages=['freegames'],
+    packages=['freegames', 'freegames.engines'],
     include_package_data=True,
     tests_require=['tox'],
     cmdclass={'test': Tox},
@@ -0,0 +1,93 @@
+"""Benchmark cannon physics with thousands of targets and balls.
+
+Compare the engine field, which keeps bodies in arrays and compacts them in
+place, with the old loop over target vectors, which copied the target list
+and built a vector per distance every tick::
+
+  $ python -m tests.benchmark_cannon
+"""
+
+import random
+import time
+
+from freegames import vector
+from freegames.engines.cannon import Field, inside
+
+TARGETS = 2000
+BALLS = 100
+TICKS = 10
+
+
+def bodies(seed=0):
+    """Return lists of target and ball (x, y, dx, dy) tuples."""
+    rng = random.Random(seed)
+    targets = []
+
+    for count in range(TARGETS):
+        x = rng.uniform(-190, 200)
+        y = rng.uniform(-150, 150)
+        targets.append((x, y, -0.5, 0))
+
+    balls = []
+
+    for count in range(BALLS):
+        balls.append((-199, -199, rng.uniform(0, 16), rng.uniform(0, 16)))
+
+    return targets, balls
+
+
+def vectors(targets, balls):
+    """Step bodies the old way and return count of targets left."""
+    targets = [vector(x, y) for x, y, dx, dy in targets]
+    balls = [[vector(x, y), vector(dx, dy)] for x, y, dx, dy in balls]
+
+    for tick in range(TICKS):
+        for target in targets:
+            target.x -= 0.5
+
+        for ball, speed in balls:
+            speed.y -= 0.35
+            ball.move(speed)
+
+        balls = [pair for pair in balls if inside(pair[0].x, pair[0].y)]
+
+        for ball, speed in balls:
+            dupe = targets.copy()
+            targets.clear()
+
+            for target in dupe:
+                if abs(target - ball) > 13:
+                    targets.append(target)
+
+    return len(targets)
+
+
+def arrays(targets, balls):
+    """Step bodies in the engine field and return count of targets left."""
+    field = Field()
+
+    for body in targets:
+        field.targets.add(*body)
+
+    for body in balls:
+        field.fire(*body)
+
+    for tick in range(TICKS):
+        field.step()
+
+    return len(field.targets)
+
+
+def main():
+    targets, balls = bodies()
+
+    for function in [vectors, arrays]:
+        start = time.perf_counter()
+        count = function(targets, balls)
+        delta = time.perf_counter() - start
+        name = function.__name__
+        print('{:>7}: {:.3f}s, {} targets left'.format(name, delta, count))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,31 @@
+"""Benchmark the flappy autopilot without a screen.
+
+Play the game as fast as possible with the autopilot tapping and report
+ticks per second and search nodes per tick. The game needs 20 ticks per
+second::
+
+  $ python -m tests.benchmark_flappy
+"""
+
+import random
+import time
+
+from freegames.engines.flappy import Pilot, play
+
+TICKS = 20000
+
+
+def main():
+    for seed in range(3):
+        pilot = Pilot()
+        start = time.perf_counter()
+        ticks = play(TICKS, pilot, random.Random(seed))
+        delta = time.perf_counter() - start
+        rate = ticks / delta
+        nodes = pilot.nodes / ticks
+        message = 'seed {}: {} ticks, {:.0f} ticks/s, {:.1f} nodes/tick'
+        print(message.format(seed, ticks, rate, nodes))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""Benchmark minesweeper reveal on a 500x500 open field.
+
+Compare the engine reveal, which marks cells when they are queued, with the
+old flood fill, which queued every hidden neighbor of an empty cell::
+
+  $ python -m tests.benchmark_minesweeper
+"""
+
+import time
+
+from freegames.engines.minesweeper import Board
+
+
+def flood(board, index):
+    """Reveal cells the old way and return count of queued cells."""
+    spots = [index]
+    queued = 1
+
+    while spots:
+        index = spots.pop()
+        board.shown[index] = True
+
+        if board.counts[index] == 0:
+            for spot in board.around(index):
+                if not board.shown[spot]:
+                    spots.append(spot)
+                    queued += 1
+
+    return queued
+
+
+def main():
+    for name in ['flood', 'reveal']:
+        board = Board(500, 500, 0)
+        start = time.perf_counter()
+
+        if name == 'flood':
+            queued = flood(board, 0)
+        else:
+            queued = len(board.reveal(0))
+
+        delta = time.perf_counter() - start
+        print('{:>6}: {:.3f}s, {} cells queued'.format(name, delta, queued))
+
+
+if __name__ == '__main__':
+    main()
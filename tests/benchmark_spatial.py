@@ -0,0 +1,67 @@
+"""Benchmark radius queries over ten thousand points.
+
+Compare the spatial hash, which only checks points in the cells around each
+query, with a loop over every point, which is how the games first tested
+collisions::
+
+  $ python -m tests.benchmark_spatial
+"""
+
+import random
+import time
+
+from freegames import SpatialHash
+
+POINTS = 10000
+QUERIES = 1000
+RADIUS = 15
+
+
+def points(seed=0):
+    """Return list of random (x, y) points and list of query points."""
+    rng = random.Random(seed)
+
+    def point():
+        return rng.uniform(-200, 200), rng.uniform(-200, 200)
+
+    return [point() for _ in range(POINTS)], [point() for _ in range(QUERIES)]
+
+
+def loop(items, queries):
+    """Check every point for every query and return count of hits."""
+    limit = RADIUS * RADIUS
+    hits = 0
+
+    for x, y in queries:
+        for px, py in items:
+            dx = px - x
+            dy = py - y
+            if dx * dx + dy * dy < limit:
+                hits += 1
+
+    return hits
+
+
+def spatial(items, queries):
+    """Query a spatial hash of the points and return count of hits."""
+    grid = SpatialHash(RADIUS * 2)
+
+    for key, (x, y) in enumerate(items):
+        grid.insert(key, x, y)
+
+    return sum(len(grid.query(x, y, RADIUS)) for x, y in queries)
+
+
+def main():
+    items, queries = points()
+
+    for function in [loop, spatial]:
+        start = time.perf_counter()
+        hits = function(items, queries)
+        delta = time.perf_counter() - start
+        name = function.__name__
+        print('{:>7}: {:.3f}s, {} hits'.format(name, delta, hits))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,8 @@
 """Mock turtle module.
 """
 
+import struct
+
 state = {}
 events = []
 
@@ -46,6 +48,12 @@ class Turtle:
         pass
 
     def stamp(self):
+        return 0
+
+    def clearstamp(self, stampid):
+        pass
+
+    def shapesize(self, stretch_wid=None, stretch_len=None, outline=None):
         pass
 
     def left(self, degrees):
@@ -79,6 +87,23 @@ class Turtle:
         pass
 
 
+class PhotoImage:
+    def __init__(self, file):
+        with open(file, 'rb') as reader:
+            header = reader.read(10)
+        self.size = struct.unpack('<HH', header[6:])
+
+    def width(self):
+        return self.size[0]
+
+    def height(self):
+        return self.size[1]
+
+    def write(self, filename, format=None, from_coords=None):
+        state.setdefault('photos', []).append((filename, from_coords))
+        open(filename, 'wb').close()
+
+
 _turtle = Turtle()
 goto = _turtle.goto
 up = _turtle.up
@@ -93,6 +118,8 @@ back = _turtle.back
 addshape = _turtle.addshape
 shape = _turtle.shape
 stamp = _turtle.stamp
+clearstamp = _turtle.clearstamp
+shapesize = _turtle.shapesize
 left = _turtle.left
 right = _turtle.right
 hideturtle = _turtle.hideturtle
@@ -13,3 +13,11 @@ def test_cannon():
         [('timer',)] * 300 + [('click', 0, 0)] + [('timer', True)] * 3000
     )
     runpy.run_module('freegames.cannon')
+
+
+def test_cannon_auto():
+    random.seed(0)
+    events = [('timer',)] * 100 + [('key a',)] + [('timer',)] * 1000
+    mockturtle.events[:] = events + [('key a',)] + [('timer', True)] * 3000
+    game = runpy.run_module('freegames.cannon')
+    assert game['field'].escaped()
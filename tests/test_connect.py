@@ -7,10 +7,12 @@ import mockturtle
 sys.modules['turtle'] = sys.modules['mockturtle']
 
 
-def test_connect():
+def test_connect(monkeypatch, tmp_path):
+    monkeypatch.setenv('FREEGAMES_CACHE', str(tmp_path))
     random.seed(0)
     mockturtle.events[:] = [
-        ('click', 25, 0),
-        ('click', 75, 0),
+        ('click', x, 0) for x in range(-175, 200, 50) for count in range(8)
     ]
-    runpy.run_module('freegames.connect')
+    mockturtle.events.append(('click', 250, 0))
+    game = runpy.run_module('freegames.connect')
+    assert game['board'].won()
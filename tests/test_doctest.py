@@ -1,8 +1,69 @@
 import doctest
 
+import freegames.engines.bodies
+import freegames.engines.cannon
+import freegames.engines.connect
+import freegames.engines.flappy
+import freegames.engines.minesolver
+import freegames.engines.minesweeper
+import freegames.engines.pong
+import freegames.engines.tictactoe
+import freegames.engines.tiles
+import freegames.engines.tron
 import freegames.utils
 
 
 def test_utils():
     failures, _ = doctest.testmod(freegames.utils)
     assert failures == 0
+
+
+def test_engines_bodies():
+    failures, _ = doctest.testmod(freegames.engines.bodies)
+    assert failures == 0
+
+
+def test_engines_cannon():
+    failures, _ = doctest.testmod(freegames.engines.cannon)
+    assert failures == 0
+
+
+def test_engines_connect():
+    failures, _ = doctest.testmod(freegames.engines.connect)
+    assert failures == 0
+
+
+def test_engines_flappy():
+    failures, _ = doctest.testmod(freegames.engines.flappy)
+    assert failures == 0
+
+
+def test_engines_pong():
+    failures, _ = doctest.testmod(freegames.engines.pong)
+    assert failures == 0
+
+
+def test_engines_tictactoe():
+    failures, _ = doctest.testmod(freegames.engines.tictactoe)
+    assert failures == 0
+
+
+def test_engines_tiles(monkeypatch, tmp_path):
+    monkeypatch.setenv('FREEGAMES_CACHE', str(tmp_path))
+    failures, _ = doctest.testmod(freegames.engines.tiles)
+    assert failures == 0
+
+
+def test_engines_tron():
+    failures, _ = doctest.testmod(freegames.engines.tron)
+    assert failures == 0
+
+
+def test_engines_minesolver():
+    failures, _ = doctest.testmod(freegames.engines.minesolver)
+    assert failures == 0
+
+
+def test_engines_minesweeper():
+    failures, _ = doctest.testmod(freegames.engines.minesweeper)
+    assert failures == 0
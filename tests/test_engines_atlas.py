@@ -0,0 +1,30 @@
+import os
+
+import mockturtle
+
+from freegames import path
+from freegames.engines import atlas
+
+
+def test_dimensions():
+    assert atlas.dimensions(path('car.gif')) == (400, 400)
+
+
+def test_slices(monkeypatch, tmp_path):
+    monkeypatch.setenv('FREEGAMES_CACHE', str(tmp_path))
+    monkeypatch.setattr(atlas, 'PhotoImage', mockturtle.PhotoImage)
+    mockturtle.state['photos'] = []
+    names = atlas.slices(path('car.gif'), 4, 2)
+    assert len(names) == 8
+    assert all(map(os.path.exists, names))
+    corners = dict(mockturtle.state['photos'])
+    folder = os.path.dirname(names[0]) + '.tmp'
+    assert corners[os.path.join(folder, '0.gif')] == (0, 200, 100, 400)
+    assert corners[os.path.join(folder, '5.gif')] == (100, 0, 200, 200)
+
+    def photo(file):
+        raise AssertionError('image sliced again')
+
+    monkeypatch.setattr(atlas, 'PhotoImage', photo)
+    assert atlas.slices(path('car.gif'), 4, 2) == names
+    assert len(list(tmp_path.iterdir())) == 1
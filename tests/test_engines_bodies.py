@@ -0,0 +1,16 @@
+from freegames.engines.bodies import Bodies
+
+
+def test_keep():
+    bodies = Bodies()
+
+    for count in range(6):
+        bodies.add(count, -count, 1, 0)
+
+    bodies.keep([count % 2 for count in range(6)])
+    assert list(bodies.xs) == [1, 3, 5]
+    assert list(bodies.ys) == [-1, -3, -5]
+    bodies.keep([True, True, True])
+    assert len(bodies) == 3
+    bodies.keep([])
+    assert len(bodies) == 0
@@ -0,0 +1,112 @@
+import random
+
+from freegames import vector
+from freegames.engines.cannon import (
+    FASTEST,
+    GRAVITY,
+    RADIUS,
+    SPEED,
+    START,
+    Field,
+    aim,
+    window,
+)
+
+
+def test_field_matches_vectors():
+    rng = random.Random(0)
+    field = Field()
+    targets = []
+
+    for count in range(300):
+        x = rng.uniform(-150, 200)
+        y = rng.uniform(-150, 150)
+        field.targets.add(x, y, -0.5, 0)
+        targets.append(vector(x, y))
+
+    balls = []
+
+    for count in range(30):
+        x, y = rng.uniform(-200, 200), rng.uniform(-200, 200)
+        dx, dy = rng.uniform(-5, 5), rng.uniform(-5, 5)
+        field.fire(x, y, dx, dy)
+        balls.append((vector(x, y), vector(dx, dy)))
+
+    hits = 0
+
+    for tick in range(20):
+        for target in targets:
+            target.x -= 0.5
+
+        for ball, speed in balls:
+            speed.y -= 0.35
+            ball.move(speed)
+
+        balls = [
+            (ball, speed)
+            for ball, speed in balls
+            if -200 < ball.x < 200 and -200 < ball.y < 200
+        ]
+        left = [
+            target
+            for target in targets
+            if all(abs(target - ball) > RADIUS for ball, speed in balls)
+        ]
+        assert field.step() == len(targets) - len(left)
+        hits += len(targets) - len(left)
+        targets = left
+        assert len(field.targets) == len(targets)
+        assert len(field.balls) == len(balls)
+
+    assert hits > 0
+
+
+def test_escaped():
+    field = Field()
+    assert field.step() == 0
+    field.spawn(0)
+    field.step()
+    assert not field.escaped()
+
+    for tick in range(800):
+        field.step()
+
+    assert field.escaped()
+
+
+def test_aim():
+    for x in range(-150, 201, 25):
+        for y in range(-150, 150, 20):
+            ticks = window(x, y)
+            speed = aim(x, y)
+            if not ticks:
+                assert speed is None
+                continue
+            dx, dy = speed
+            assert 0 <= dx <= FASTEST and 0 <= dy <= FASTEST
+            field = Field()
+            field.targets.add(x, y, -SPEED, 0)
+            field.fire(START, START, dx, dy)
+            count = 0
+            while len(field.targets):
+                count += 1
+                field.step()
+                assert len(field.balls) == 1
+            assert count <= ticks[0]
+
+
+def test_window_cached():
+    window.cache_clear()
+    window(100, 50)
+    window(100, 50)
+    assert window.cache_info().hits == 1
+    assert not window(-195, 150)
+    assert aim(-195, 150) is None
+    assert not window(-199, 199)
+
+
+def test_hit_at_radius():
+    field = Field()
+    field.targets.add(0, 0, 0, 0)
+    field.fire(RADIUS, GRAVITY, 0, 0)
+    assert field.step() == 1
@@ -0,0 +1,207 @@
+import random
+import runpy
+import time
+from unittest import mock
+
+import freegames.engines.connect as connect
+from freegames.engines.connect import (
+    EXACT,
+    WIN,
+    Analyst,
+    Board,
+    Book,
+    Player,
+    Table,
+    four,
+)
+
+
+def build(columns, rows, moves):
+    board = Board(columns, rows)
+    for column in moves:
+        board.play(column)
+    return board
+
+
+def test_lines():
+    assert build(7, 6, [0, 0, 1, 1, 2, 2, 3]).won()
+    assert build(7, 6, [3, 3, 3, 3, 3, 3, 0]).heights[3] == 6
+    assert build(7, 6, [0, 1, 1, 2, 2, 3, 2, 3, 3, 6, 3]).won()
+    assert build(7, 6, [6, 5, 5, 4, 4, 3, 4, 3, 3, 0, 3]).won()
+
+
+def test_no_wrap():
+    board = build(7, 3, [0, 1, 0, 1, 0, 6, 1, 6])
+    assert not four(board.players[0], board.stride)
+    assert not four(board.players[1], board.stride)
+
+
+def test_playable():
+    board = build(2, 2, [0, 0])
+    assert not board.playable(0)
+    assert board.playable(1)
+    assert not board.playable(2)
+    assert not board.playable(-1)
+    board.play(1)
+    board.play(1)
+    assert board.full()
+    assert not board.won()
+
+
+def test_undo():
+    board = build(8, 8, [0, 1, 2])
+    board.undo()
+    assert board.heights == [1, 1, 0, 0, 0, 0, 0, 0]
+    assert board.players == [board.bit(0, 0), board.bit(1, 0)]
+    assert board.player == 0
+
+
+def test_wide():
+    board = build(40, 5, [36, 0, 37, 0, 38, 0, 39])
+    assert board.won()
+    assert board.players[0].bit_length() > 64
+
+
+def outcome(board, memo):
+    """Return 1, 0 or -1 as the player to move wins, draws or loses."""
+    key = board.key()
+
+    if key not in memo:
+        result = -1
+
+        if board.full():
+            result = 0
+
+        for column in range(board.columns):
+            if board.playable(column) and result < 1:
+                board.play(column)
+                if board.won():
+                    value = 1
+                else:
+                    value = -outcome(board, memo)
+                board.undo()
+                result = max(result, value)
+
+        memo[key] = result
+
+    return memo[key]
+
+
+def test_negamax_exact():
+    rng = random.Random(0)
+    memo = {}
+    player = Player()
+    tested = 0
+
+    while tested < 30:
+        board = Board(4, 4)
+        for count in range(rng.randrange(3, 10)):
+            column = rng.choice([x for x in range(4) if board.playable(x)])
+            board.play(column)
+            if board.won():
+                break
+        if board.won():
+            continue
+        empty = 16 - len(board.moves)
+        value = player.negamax(board, empty, -2 * WIN, 2 * WIN)
+        sign = (value > 0) - (value < 0)
+        assert sign == outcome(board, memo)
+        tested += 1
+
+
+def test_move_wins_and_blocks():
+    board = build(7, 6, [0, 6, 1, 6, 2, 6])
+    assert Player(depth=2).move(board) == 3
+    board = build(7, 6, [0, 6, 1, 6, 2])
+    assert Player(depth=2).move(board) == 3
+
+
+def test_move_budget():
+    board = Board(8, 8)
+    player = Player(budget=0.05)
+    start = time.perf_counter()
+    assert player.move(board) in (3, 4)
+    assert time.perf_counter() - start < 1
+    assert player.nodes > 0
+
+
+def test_move_proven():
+    board = build(4, 4, [0, 1, 0, 1, 3, 2])
+    player = Player(budget=60)
+    assert player.move(board) in range(4)
+
+
+def test_table_age():
+    table = Table(4)
+    table.store(5, 3, EXACT, 10, 2)
+    table.store(9, 1, EXACT, 20, 0)
+    assert table.get(9) is None
+    table.age += 1
+    table.store(9, 1, EXACT, 20, 0)
+    assert table.get(9)[3] == 20
+    assert table.get(5) is None
+
+
+def test_analyze():
+    board = build(7, 6, [3, 3, 2])
+    player = Player()
+    best = max(
+        (-player.negamax(child, 3, -2 * WIN, 2 * WIN), column)
+        for column, child in children(board)
+    )
+    analyst = Analyst(workers=1)
+    assert analyst.analyze(board, 4)[0] == best[0]
+    analyst.close()
+    analyst = Analyst(workers=2)
+    assert analyst.analyze(board, 4)[0] == best[0]
+    assert analyst.analyze(build(7, 6, [0, 6, 1, 6, 2]), 4)[1] == 3
+    assert analyst.analyze(build(7, 6, [0, 6, 1, 6, 2, 5]), 4)[1] == 3
+    analyst.close()
+
+
+def children(board):
+    for column in range(board.columns):
+        if board.playable(column):
+            child = build(board.columns, board.rows, board.moves + [column])
+            yield column, child
+
+
+def test_book(tmp_path):
+    name = str(tmp_path / 'connect.book')
+    assert connect.write(name, 4, 4, plies=3, depth=3, workers=1) == 21
+    book = Book(name, 4, 4)
+    assert len(book) == 21
+    analyst = Analyst(workers=1)
+
+    for moves in connect.openings(4, 4, 3):
+        board = build(4, 4, moves)
+        value, column = analyst.analyze(board, 3)
+        assert book.get(board) == column
+
+    assert book.get(build(4, 4, [0, 0, 0])) is None
+    assert book.get(build(4, 4, [3, 3, 3, 3])) is None
+    player = Player(book=book, depth=1)
+    assert player.move(Board(4, 4)) == book.get(Board(4, 4))
+    assert player.nodes == 0
+    assert player.move(build(4, 4, [0, 0, 0])) in range(4)
+    assert len(Book(str(tmp_path / 'missing.book'), 4, 4)) == 0
+
+
+def test_main(monkeypatch, tmp_path, capsys):
+    monkeypatch.setenv('FREEGAMES_CACHE', str(tmp_path))
+    args = ['connect.py', '--columns', '4', '--rows', '4', '--plies', '2']
+    args += ['--depth', '2', '--workers', '1']
+
+    with mock.patch('sys.argv', args):
+        runpy.run_module('freegames.engines.connect', run_name='__main__')
+
+    assert capsys.readouterr().out.startswith('Wrote 5 positions')
+    assert len(Book(connect.location(4, 4), 4, 4)) == 5
+
+
+def test_openings():
+    assert len(connect.openings(4, 4, 4)) == 73
+    assert len(connect.openings(2, 2, 6)) == 13
+    positions = connect.openings(4, 4, 8)
+    assert len(positions) == 4249
+    assert not any(build(4, 4, moves).won() for moves in positions)
@@ -0,0 +1,37 @@
+import random
+
+from freegames.engines.flappy import HORIZON, Course, Pilot, play
+
+
+def test_course_expires():
+    course = Course()
+
+    for tick in range(200):
+        course.spawn(tick % 50)
+        course.advance()
+        assert all(-200 < x < 200 for x, y in course)
+
+    assert len(course) == 132
+    assert len(course.grid) == len(course)
+
+
+def test_pilot_trapped():
+    course = Course()
+    course.spawn(194)
+
+    for tick in range(65):
+        course.advance()
+
+    assert not Pilot().tap(course, 0, 199)
+
+
+def test_play():
+    for seed in range(3):
+        pilot = Pilot()
+        assert play(2000, pilot, random.Random(seed)) == 2000
+        assert len(pilot.dead) <= HORIZON
+        assert pilot.nodes < 2000 * HORIZON * 2
+
+
+def test_play_crash():
+    assert play(2000, Pilot(horizon=1), random.Random(0)) < 2000
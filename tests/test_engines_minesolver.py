@@ -0,0 +1,96 @@
+import random
+
+from pytest import raises
+
+import freegames.engines.minesolver as minesolver
+from freegames.engines.minesweeper import Board, tally
+
+
+def make(columns, rows, mines):
+    board = Board(columns, rows, 0)
+
+    for index in mines:
+        board.mines[index] = 1
+
+    board.counts = tally(board.mines, columns, rows)
+    return board
+
+
+def test_subset_rule():
+    # Revealed row 1-2-1 over hidden row: the middle hidden cell is safe.
+    board = make(3, 2, [0, 2])
+
+    for index in [3, 4, 5]:
+        board.shown[index] = 1
+
+    solver = minesolver.Solver(board)
+    solver.update([3, 4, 5])
+    safe, mines = solver.solve()
+    assert safe == {1}
+    assert mines == {0, 2}
+    assert solver.hint() == 1
+
+
+def test_enumeration():
+    constraints = [
+        (frozenset([0, 1]), 1),
+        (frozenset([1, 2]), 1),
+        (frozenset([2, 3]), 1),
+        (frozenset([3, 4]), 1),
+        (frozenset([0, 4]), 1),
+    ]
+    assert minesolver.deduce(constraints) == (set(), set())
+    constraints = [
+        (frozenset([0, 1, 2]), 1),
+        (frozenset([1, 2, 3]), 1),
+        (frozenset([0, 3, 4]), 1),
+    ]
+    assert minesolver.deduce(constraints) == ({0, 3}, {4})
+    assert minesolver.deduce(constraints, limit=4) == (set(), set())
+
+
+def test_cache():
+    board = make(3, 2, [0, 2])
+    solver = minesolver.Solver(board)
+    solver.update(board.reveal(4))
+    solver.update(board.reveal(3))
+    assert solver.solve() == (set(), set())
+    assert len(solver.cache) == 1
+    solver.update(board.reveal(5))
+    assert solver.solve() == ({1}, {0, 2})
+    solver.update(board.reveal(1))
+    assert solver.hint() is None
+    assert solver.touched == set()
+
+
+def test_cache_bounded():
+    rng = random.Random(0)
+    board = minesolver.generate(16, 16, 40, 17, rng)
+    results = []
+
+    for capacity in [1, 1 << 12]:
+        board.shown[:] = bytes(len(board.shown))
+        solver = minesolver.Solver(board, capacity=capacity)
+        solver.update(board.reveal(17))
+        safe, mines = solver.solve()
+        while safe:
+            for cell in list(safe):
+                solver.update(board.reveal(cell))
+            safe, mines = solver.solve()
+        assert len(solver.cache) <= capacity
+        results.append((bytes(board.shown), set(mines)))
+
+    assert results[0] == results[1]
+
+
+def test_generate():
+    rng = random.Random(0)
+
+    for count in range(10):
+        board = minesolver.generate(16, 16, 40, 17, rng)
+        assert minesolver.solvable(board, 17)
+
+
+def test_generate_error():
+    with raises(ValueError):
+        minesolver.generate(4, 4, 10, 0, random.Random(0), tries=10)
@@ -0,0 +1,106 @@
+import random
+
+from pytest import raises
+
+import freegames.engines.minesweeper as minesweeper
+
+
+def test_tally():
+    rng = random.Random(0)
+
+    for columns, rows in [(1, 1), (3, 7), (10, 4), (13, 13)]:
+        board = minesweeper.Board(columns, rows, columns * rows // 3, rng)
+        counts = [
+            sum(board.mines[spot] for spot in board.around(index))
+            for index in range(columns * rows)
+        ]
+        assert list(board.counts) == counts
+
+
+def test_large_board():
+    board = minesweeper.Board(1000, 1000, 150000)
+    assert len(board.counts) == 1000000
+    assert sum(board.mines) == 150000
+
+
+def test_reveal_open_field():
+    board = minesweeper.Board(500, 500, 0)
+    spots = board.reveal(board.cell(250, 250))
+    assert len(spots) == len(set(spots)) == 250000
+    assert all(board.shown)
+
+
+def test_reveal_stops_at_counts():
+    board = minesweeper.Board(5, 1, 0)
+    board.mines[2] = 1
+    board.counts = minesweeper.tally(board.mines, 5, 1)
+    assert board.reveal(0) == [0, 1]
+    assert board.reveal(3) == [3]
+    assert not board.shown[2]
+
+
+def test_infinite_counts():
+    board = minesweeper.InfiniteBoard(seed=3, capacity=4)
+    rng = random.Random(0)
+
+    for count in range(500):
+        spot = rng.randrange(-100, 100), rng.randrange(-100, 100)
+        total = sum(board.mines[other] for other in board.around(spot))
+        assert board.counts[spot] == total
+
+    assert len(board.chunks) == 4
+    assert board.inside(10**9, -(10**9))
+    assert board.position(board.cell(3, 4)) == (3, 4)
+
+
+def test_infinite_start_is_safe():
+    for seed in range(20):
+        board = minesweeper.InfiniteBoard(seed=seed, density=0.9)
+        assert board.counts[0, 0] == 0
+        assert not board.chunks.keys() - {(0, 0), (-1, -1), (-1, 0), (0, -1)}
+
+
+def test_infinite_lazy_chunks():
+    board = minesweeper.InfiniteBoard(seed=0)
+    board.mines[1000, 1000]
+    assert not board.shown[1000, 1000]
+    assert not board.chunks
+    board.reveal((0, 0))
+    assert board.chunks
+
+
+def test_infinite_eviction():
+    board = minesweeper.InfiniteBoard(seed=0, capacity=4)
+    board.focus(-4, -4, 8, 8)
+    assert board.view == {(-1, -1), (-1, 0), (0, -1), (0, 0)}
+    spots = board.reveal((0, 0))
+    keys = {board.split(spot)[0] for spot in spots}
+    assert set(board.chunks) == keys
+    board.focus(1000, 1000, 8, 8)
+    board.counts[1000, 1000]
+    assert len(board.chunks) == 4
+    assert (62, 62) in board.chunks
+    assert set(board.explored) | set(board.chunks) >= keys
+    assert all(board.shown[spot] for spot in spots)
+    assert board.reveal(spots[0]) == []
+    board.counts[spots[0]]
+    assert all(board.shown[spot] for spot in spots)
+
+
+def test_infinite_small_capacity():
+    board = minesweeper.InfiniteBoard(seed=0, capacity=1)
+    board.focus(0, 0, 8, 8)
+    spots = board.reveal((0, 0))
+    assert all(board.shown[spot] for spot in spots)
+    assert len(board.chunks) <= 2
+
+    with raises(ValueError):
+        board.focus(-4, -4, 8, 8)
+
+
+def test_infinite_sparse():
+    with raises(ValueError):
+        minesweeper.InfiniteBoard(density=0.02)
+
+    board = minesweeper.InfiniteBoard(density=minesweeper.SPARSEST)
+    assert board.reveal((0, 0))
@@ -0,0 +1,103 @@
+import random
+
+from freegames.engines.pong import (
+    BOTTOM,
+    LEFT,
+    PADDLE,
+    RIGHT,
+    TOP,
+    Court,
+    bounce,
+    intercept,
+)
+
+
+def step(x, y, dx, dy, plane, count=100):
+    """Move ball in small steps until it passes `plane`."""
+    dx /= count
+    dy /= count
+    time = 0
+
+    while True:
+        x += dx
+        y += dy
+        time += 1
+
+        if (dx > 0 and x > plane) or (dx < 0 and x < plane):
+            return time / count, y
+
+        if y < BOTTOM or y > TOP:
+            y, dy = bounce(y, dy)
+
+
+def test_intercept():
+    rng = random.Random(0)
+
+    for count in range(300):
+        x, y = rng.uniform(-180, 180), rng.uniform(-200, 200)
+        dx = (3 + rng.random() * 2) * rng.choice([1, -1])
+        dy = (1 + rng.random() * 20) * rng.choice([1, -1])
+        plane = RIGHT if dx > 0 else LEFT
+        time, height = intercept(x, y, dx, dy, plane)
+        expected_time, expected = step(x, y, dx, dy, plane)
+        assert abs(time - expected_time) <= 0.01
+        assert abs(height - expected) <= abs(dy) / 100
+
+
+def test_bounce():
+    assert bounce(200, 5) == (200, 5)
+    assert bounce(-200, -5) == (-200, -5)
+    assert bounce(610, 5) == (-190, 5)
+    assert bounce(1010, 5) == (190, -5)
+
+
+def test_fast_ball_hits_paddle():
+    court = Court()
+    court.serve(0, 10, 300, 100)
+    assert court.step(-100, 40) == 0
+    assert list(court.balls.xs) == [70]
+    assert list(court.balls.ys) == [110]
+    assert list(court.balls.dxs) == [-300]
+    court.serve(0, 10, 300, 100)
+    assert court.step(150, -100) == 1
+    assert len(court.balls) == 1
+
+
+def test_fast_ball_hits_wall():
+    court = Court()
+    court.serve(0, 150, 0, 120)
+    court.step(0, 0)
+    assert list(court.balls.ys) == [130]
+    assert list(court.balls.dys) == [-120]
+
+
+def test_many_balls():
+    rng = random.Random(0)
+    court = Court()
+    served = 500
+
+    for count in range(served):
+        dx = rng.uniform(20, 300) * rng.choice([1, -1])
+        dy = rng.uniform(-500, 500)
+        court.serve(0, rng.uniform(-200, 200), dx, dy)
+
+    missed = 0
+
+    for frame in range(20):
+        missed += court.step(-25, -25)
+        balls = court.balls
+        for x, y in zip(balls.xs, balls.ys):
+            assert LEFT <= x <= RIGHT
+            assert BOTTOM <= y <= TOP
+        assert missed + len(balls) == served
+
+    assert 0 < len(court.balls) < served
+
+
+def test_paddle_edges():
+    court = Court()
+    court.serve(180, 0, 10, 0)
+    court.serve(180, PADDLE, 10, 0)
+    court.serve(180, PADDLE + 1, 10, 0)
+    assert court.step(0, 0) == 1
+    assert list(court.balls.dxs) == [-10, -10]
@@ -0,0 +1,102 @@
+import random
+
+from freegames.engines.tictactoe import Board, Player, lines, symmetries
+
+
+def build(moves, *args):
+    board = Board(*args)
+    for cell in moves:
+        board.play(cell)
+    return board
+
+
+def outcome(board, memo):
+    """Return 1, 0 or -1 as the player to move wins, draws or loses."""
+    key = tuple(board.players)
+
+    if key not in memo:
+        if board.won():
+            result = -1
+        elif board.full():
+            result = 0
+        else:
+            result = -1
+            for cell in range(board.size):
+                if board.playable(cell):
+                    board.play(cell)
+                    result = max(result, -outcome(board, memo))
+                    board.undo()
+        memo[key] = result
+
+    return memo[key]
+
+
+def test_lines():
+    assert len(lines(3, 3, 3)) == 8
+    assert len(lines(4, 4, 4)) == 10
+    assert len(lines(7, 7, 5)) == 60
+    assert len(lines(5, 3, 3)) == 3 * 3 + 5 + 3 * 2
+
+
+def test_symmetries():
+    for columns, rows in [(3, 3), (4, 3), (7, 7)]:
+        for permutation in symmetries(columns, rows):
+            assert sorted(permutation) == list(range(columns * rows))
+
+
+def test_key():
+    rng = random.Random(0)
+
+    for count in range(20):
+        cells = rng.sample(range(16), 7)
+        board = build(cells, 4, 4, 4)
+        key = board.key()
+
+        for permutation in symmetries(4, 4):
+            other = build([permutation[cell] for cell in cells], 4, 4, 4)
+            assert other.key() == key
+
+
+def test_perfect():
+    rng = random.Random(0)
+    player = Player(capacity=64)
+    memo = {}
+
+    for count in range(40):
+        board = build(rng.sample(range(9), rng.randrange(0, 6)))
+        if board.won():
+            continue
+        value = player.negamax(board, 9, -2000, 2000)
+        assert (value > 0) - (value < 0) == outcome(board, memo)
+
+    assert len(player.cache) <= 64
+
+
+def test_self_play():
+    board = Board()
+    player = Player()
+
+    while not board.won() and not board.full():
+        board.play(player.move(board))
+
+    assert not board.won()
+
+
+def test_block():
+    board = build([0, 48, 1, 47, 2, 46, 3], 7, 7, 5)
+    assert Player(depth=2).move(board) == 4
+    assert Board(7, 7, 5).score() == 0
+
+
+def test_counts():
+    board = build([0, 4, 1, 5])
+    assert board.occupied == 0b110011
+    assert not board.playable(4)
+    assert board.playable(2)
+    board.play(2)
+    assert board.won()
+    assert board.complete == 1
+    board.undo()
+    assert not board.won()
+    assert board.counts[0][0] == 2
+    assert board.occupied == 0b110011
@@ -0,0 +1,162 @@
+import collections
+import itertools
+import random
+import runpy
+import sys
+
+import pytest
+
+import freegames.engines.tiles as tiles
+
+
+def slides(size):
+    """Return set of boards reachable from the solved board."""
+    start = tuple(tiles.solved(size))
+    seen = {start}
+    queue = [start]
+
+    for board in queue:
+        blank = board.index(None)
+        column, row = blank % size, blank // size
+
+        for x, y in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
+            if 0 <= column + x < size and 0 <= row + y < size:
+                spot = blank + x + y * size
+                board_next = list(board)
+                board_next[blank] = board[spot]
+                board_next[spot] = None
+                board_next = tuple(board_next)
+                if board_next not in seen:
+                    seen.add(board_next)
+                    queue.append(board_next)
+
+    return seen
+
+
+def neighbors_of(board, size):
+    """Return boards one slide away from `board`."""
+    blank = board.index(None)
+
+    for spot in tiles.neighbors(size)[blank]:
+        other = list(board)
+        other[blank], other[spot] = board[spot], None
+        yield tuple(other)
+
+
+def test_solvable():
+    for size in [2, 3]:
+        reachable = slides(size)
+        boards = itertools.permutations(tiles.solved(size))
+        if size == 3:
+            boards = itertools.islice(boards, 0, None, 97)
+        for board in boards:
+            assert tiles.solvable(list(board), size) == (board in reachable)
+
+
+def test_scramble_uniform():
+    rng = random.Random(0)
+    counts = collections.Counter(
+        tuple(tiles.scramble(2, rng)) for count in range(12000)
+    )
+    assert len(counts) == 12
+    assert min(counts.values()) > 900
+
+
+def test_scramble_large():
+    board = tiles.scramble(100)
+    assert tiles.solvable(board, 100)
+    assert tiles.distance(board, 100) > 0
+    assert tiles.distance(tiles.solved(100), 100) == 0
+
+
+def test_neighbors():
+    table = tiles.neighbors(3)
+    assert table[4] == [5, 3, 7, 1]
+    assert all(
+        cell in table[spot] for cell in range(9) for spot in table[cell]
+    )
+
+
+def test_patterns():
+    groups = tiles.patterns(5)
+    assert sum(groups, ()) == tuple(range(1, 25))
+
+
+def test_solve(monkeypatch, tmp_path):
+    monkeypatch.setenv('FREEGAMES_CACHE', str(tmp_path))
+    reachable = slides(3)
+    start = tuple(tiles.solved(3))
+    depths = {start: 0}
+    queue = [start]
+
+    for board in queue:
+        for other in neighbors_of(board, 3):
+            if other not in depths:
+                depths[other] = depths[board] + 1
+                queue.append(other)
+
+    rng = random.Random(0)
+
+    for board in rng.sample(sorted(reachable, key=str), 40):
+        board = list(board)
+        moves = tiles.solve(board)
+        assert len(moves) == depths[tuple(board)]
+
+        for tile in moves:
+            blank = board.index(None)
+            spot = board.index(tile)
+            assert spot in tiles.neighbors(3)[blank]
+            board[blank], board[spot] = tile, None
+
+        assert board == tiles.solved(3)
+
+    assert tiles.solve(tiles.solved(3)) == []
+
+
+def test_solve_unsolvable(monkeypatch, tmp_path):
+    monkeypatch.setenv('FREEGAMES_CACHE', str(tmp_path))
+    with pytest.raises(ValueError):
+        tiles.solve([2, 1, 3, None])
+
+
+def test_database(monkeypatch, tmp_path):
+    monkeypatch.setenv('FREEGAMES_CACHE', str(tmp_path))
+    moves = tiles.database(3, (1, 2))
+    assert len(moves) == 81
+    assert moves[0 + 1 * 9] == 0
+    assert moves[1 + 1 * 9] == 255
+    assert list(tmp_path.iterdir()) == [tmp_path / 'tiles-3-1-2.pdb']
+
+    def build(size, group):
+        raise AssertionError('database rebuilt')
+
+    monkeypatch.setattr(tiles, 'build', build)
+    assert tiles.database(3, (1, 2))[:] == moves[:]
+
+
+def test_solve_fifteen(monkeypatch, tmp_path):
+    monkeypatch.setenv('FREEGAMES_CACHE', str(tmp_path))
+    monkeypatch.delitem(tiles.PATTERNS, 4)
+    board = tiles.solved(4)
+    board[14], board[15] = None, 15
+    board[10], board[14] = board[14], board[10]
+    assert tiles.solve(board) == [11, 15]
+
+
+def test_solve_timeout(monkeypatch, tmp_path):
+    monkeypatch.setenv('FREEGAMES_CACHE', str(tmp_path))
+    board = tiles.solved(3)
+    board[7], board[8] = None, 8
+
+    with pytest.raises(tiles.Timeout):
+        tiles.solve(board, budget=-1)
+
+    assert tiles.solve(board, budget=10) == [8]
+
+
+def test_main(monkeypatch, tmp_path, capsys):
+    monkeypatch.setenv('FREEGAMES_CACHE', str(tmp_path))
+    monkeypatch.setattr(sys, 'argv', ['tiles.py', '--size', '2'])
+    runpy.run_module('freegames.engines.tiles', run_name='__main__')
+    assert capsys.readouterr().out.startswith('Built')
+    assert tiles.ready(2)
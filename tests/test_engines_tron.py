@@ -0,0 +1,115 @@
+import csv
+import json
+import runpy
+import unittest.mock as mock
+
+import freegames.engines.tron as tron
+
+
+def test_play_draw():
+    with mock.patch.object(tron, 'LIMIT', 10):
+        result = tron.play(('dodge', 'greedy', 0))
+    assert result['score'] == 0.5
+    assert result['ticks'] == 10
+
+
+def test_play_head_on():
+    result = tron.play(('straight', 'straight', 0))
+    assert result['score'] == 0.5
+    assert result['ticks'] == 25
+
+
+def test_play_loss():
+    result = tron.play(('straight', 'dodge', 0))
+    assert result['score'] == 0.0
+
+
+def test_arena_players():
+    for count in range(2, 17):
+        arena = tron.Arena(count)
+        assert len(set(arena.heads)) == count
+        assert all(map(tron.inside, arena.heads))
+
+
+def test_arena_step():
+    arena = tron.Arena(3)
+    arena.heads = [(0, 0), (3, 0), (49, 0)]
+    arena.aims = [(1, 0), (-1, 0), (1, 0)]
+    assert arena.step(arena.aims) == [2]
+    assert arena.alive == [0, 1]
+    assert arena.step(arena.aims) == [0, 1]
+    assert arena.alive == []
+    assert arena.cells[tron.index((1, 0))] == 1
+
+
+def test_arena_same_cell():
+    arena = tron.Arena(3)
+    arena.heads = [(0, 0), (2, 0), (1, 5)]
+    arena.aims = [(1, 0), (-1, 0), (0, 1)]
+    assert arena.step(arena.aims) == [0, 1]
+    assert arena.alive == [2]
+    assert arena.cells[tron.index((1, 0))] == 0
+
+
+def test_dodge_trapped():
+    arena = tron.Arena()
+    arena.heads = [(49, 49), (0, 0)]
+    arena.cells[tron.index((49, 48))] = 2
+    aim = tron.dodge(arena, 0, tron.random.Random(0))
+    assert aim == (1, 0)
+
+
+def test_dodge_danger():
+    arena = tron.Arena()
+    arena.heads = [(0, 0), (2, 0)]
+    arena.aims = [(1, 0), (-1, 0)]
+    rng = tron.random.Random(0)
+    assert tron.dodge(arena, 0, rng) in [(0, 1), (0, -1)]
+    arena.cells[tron.index((0, 1))] = 2
+    arena.cells[tron.index((0, -1))] = 2
+    assert tron.dodge(arena, 0, rng) == (1, 0)
+
+
+def test_wander():
+    arena = tron.Arena()
+    rng = tron.random.Random(0)
+    aims = {tron.wander(arena, 0, rng) for count in range(100)}
+    assert aims == {(1, 0), (0, 1), (0, -1)}
+
+
+def test_tournament_csv(tmp_path):
+    filename = str(tmp_path / 'results.csv')
+    ratings = tron.tournament(['dodge', 'straight'], 2, filename, workers=1)
+    assert ratings['dodge'] > ratings['straight']
+
+    with open(filename) as reader:
+        rows = list(csv.DictReader(reader))
+
+    assert len(rows) == 4
+    assert rows[0]['first'] == 'dodge'
+
+
+def test_tournament_jsonl(tmp_path):
+    filename = str(tmp_path / 'results.jsonl')
+    names = ['greedy', 'straight', 'wander']
+    ratings = tron.tournament(names, 2, filename, workers=2)
+    assert sum(ratings.values()) == 3 * tron.RATING
+
+    with open(filename) as reader:
+        results = [json.loads(line) for line in reader]
+
+    assert len(results) == 12
+    assert sorted(result['seed'] for result in results) == list(range(12))
+    other = str(tmp_path / 'other.jsonl')
+    assert tron.tournament(names, 2, other, workers=1) == ratings
+
+
+def test_main(tmp_path, capsys):
+    filename = str(tmp_path / 'results.csv')
+    args = ['tron.py', filename, '--rounds', '1', '--workers', '1']
+
+    with mock.patch('sys.argv', args):
+        runpy.run_module('freegames.engines.tron', run_name='__main__')
+
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == len(tron.bots)
@@ -17,3 +17,10 @@ def test_flappy_collision():
     random.seed(0)
     mockturtle.events[:] = ([('timer', True)] * 6 + [('click', 0, 0)]) * 100
     runpy.run_module('freegames.flappy')
+
+
+def test_flappy_auto():
+    random.seed(0)
+    mockturtle.events[:] = [('key a',)] + [('timer', True)] * 1000
+    game = runpy.run_module('freegames.flappy')
+    assert game['course'].tick == 1001
@@ -4,18 +4,32 @@ import sys
 
 import mockturtle
 
+import freegames.engines.atlas as atlas
+
 sys.modules['turtle'] = sys.modules['mockturtle']
 
 
-def test_memory():
+def test_memory(monkeypatch, tmp_path):
+    monkeypatch.setenv('FREEGAMES_CACHE', str(tmp_path))
+    monkeypatch.setattr(atlas, 'PhotoImage', mockturtle.PhotoImage)
     random.seed(0)
     events = []
 
     for x in range(-200, 200, 50):
         for y in range(-200, 200, 50):
-            events += [('timer',)] * 10
             events += [('click', x + 25, y + 25)]
 
-    events += [('timer',)] * 10
     mockturtle.events[:] = events
-    runpy.run_module('freegames.memory')
+    game = runpy.run_module('freegames.memory')
+    tiles = game['tiles']
+    first = tiles.index(0)
+    second = tiles.index(0, first + 1)
+    spots = [first, second, second, first]
+    random.seed(0)
+    mockturtle.events[:] = [
+        ('click', spot % 8 * 50 - 175, spot // 8 * 50 - 175) for spot in spots
+    ]
+    game = runpy.run_module('freegames.memory')
+    assert not game['hide'][first]
+    assert sum(game['hide']) == 62
+    assert len(list(tmp_path.iterdir())) == 1
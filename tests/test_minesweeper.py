@@ -11,9 +11,17 @@ sys.modules['turtle'] = sys.modules['mockturtle']
 def test_minesweeper():
     random.seed(0)
     mockturtle.events[:] = (
+        ('key h',),
+        ('click', 200, 0),
         ('click', 175, -175),
+        ('key h',),
+        ('key h',),
+        ('key Right',),
+        ('key Up',),
+        ('key Left',),
+        ('key Down',),
         ('click', -75, -75),
-        ('click', 125, 125),
+        ('click', -75, -175),
     )
 
     try:
@@ -21,3 +29,31 @@ def test_minesweeper():
             runpy.run_module('freegames.minesweeper')
     except SystemExit:
         pass
+
+
+def test_minesweeper_endless():
+    random.seed(0)
+    mockturtle.events[:] = (
+        ('key i',),
+        ('click', 25, 25),
+        ('key h',),
+        ('key Left',),
+        ('key Down',),
+        ('key Right',),
+        ('key Up',),
+        ('click', -175, -75),
+    )
+    runpy.run_module('freegames.minesweeper')
+
+
+def test_minesweeper_margin():
+    mockturtle.events[:] = [('key i',)] + [
+        ('click', x, y) for x, y in [(205, 0), (-205, 0), (0, 205), (0, -205)]
+    ]
+    game = runpy.run_module('freegames.minesweeper')
+    board = game['state']['board']
+    assert not any(
+        board.shown[board.cell(column, row)]
+        for column in range(-5, 5)
+        for row in range(-5, 5)
+    )
@@ -23,3 +23,21 @@ def test_pong_2():
     mockturtle.events += [('timer',), ('key i',)] * 6
     mockturtle.events += [('timer', True)] * 600
     runpy.run_module('freegames.pong')
+
+
+def test_pong_auto():
+    random.seed(1)
+    mockturtle.events.clear()
+    mockturtle.events += [('key a',)]
+    mockturtle.events += [('timer', True)] * 3000
+    game = runpy.run_module('freegames.pong')
+    assert not game['court'].balls
+
+
+def test_pong_balls():
+    random.seed(2)
+    mockturtle.events.clear()
+    mockturtle.events += [('key a',), ('key b',), ('key b',)]
+    mockturtle.events += [('timer', True)] * 3000
+    game = runpy.run_module('freegames.pong')
+    assert not game['court'].balls
@@ -1,23 +1,63 @@
 import random
 import runpy
 import sys
-import unittest.mock as mock
 
 import mockturtle
+import pytest
 
 sys.modules['turtle'] = sys.modules['mockturtle']
 
 
+def click(tile):
+    """Return click event at the center of `tile` in the 2x2 grid."""
+    return 'click', tile % 2 * 200 - 100, tile // 2 * 200 - 100
+
+
 def test_simonsays():
+    random.seed(0)
+    first = random.randrange(4)
+    second = random.randrange(4)
     random.seed(0)
     mockturtle.events[:] = (
-        ('click', 0, 0),
-        ('click', -100, -100),
-        ('click', 100, 100),
+        [('click', 0, 0), click(first)]
+        + [('timer', True)] * 4
+        + [('click', 205, 0), click(first)]
+        + [('timer', True)] * 10
+        + [click(first), click(second)]
+        + [('timer', True)] * 20
+        + [click(3 - first)]
     )
 
     try:
-        with mock.patch('time.sleep', lambda delay: None):
-            runpy.run_module('freegames.simonsays')
+        runpy.run_module('freegames.simonsays')
     except SystemExit:
         pass
+    else:
+        assert False, 'expected wrong tap to end game'
+
+
+def test_simonsays_layouts():
+    mockturtle.events[:] = []
+    game = runpy.run_module('freegames.simonsays')
+    rng = random.Random(0)
+
+    for columns, rows in [(3, 3), (3, 4), (5, 2), (7, 7), (15, 17)]:
+        size, spots = game['layout'](columns, rows)
+        lookup = game['table'](size, spots)
+
+        for count in range(2000):
+            x, y = rng.uniform(-210, 210), rng.uniform(-210, 210)
+            expected = 255
+            for tile, (left, bottom) in enumerate(spots):
+                if left <= x < left + size and bottom <= y < bottom + size:
+                    expected = tile
+            assert game['find'](lookup, x, y) == expected
+
+    size, spots = game['layout'](3, 3)
+    lookup = game['table'](size, spots)
+    assert game['find'](lookup, -198, -198) == 0
+    assert game['find'](lookup, -75, -100) == 0
+    assert game['find'](lookup, 185, 185) == 8
+
+    with pytest.raises(AssertionError):
+        game['layout'](16, 16)
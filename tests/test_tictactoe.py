@@ -7,10 +7,22 @@ import mockturtle
 sys.modules['turtle'] = sys.modules['mockturtle']
 
 
-def test_tictactoe():
+def test_tictactoe(capsys):
     random.seed(0)
     mockturtle.events[:] = [
-        ('click', 100, 100),
-        ('click', 100, 0),
+        ('click', x, y) for y in [-150, 0, 150] for x in [-150, 0, 150]
+    ]
+    mockturtle.events.append(('click', 250, 0))
+    game = runpy.run_module('freegames.tictactoe')
+    assert game['board'].won()
+    assert capsys.readouterr().out == 'O wins!\n'
+
+
+def test_tictactoe_draw(capsys):
+    cells = [4, 1, 3, 2, 8]
+    mockturtle.events[:] = [
+        ('click', cell % 3 * 133 - 150, cell // 3 * 133 - 150)
+        for cell in cells
     ]
     runpy.run_module('freegames.tictactoe')
+    assert capsys.readouterr().out == 'Draw!\n'
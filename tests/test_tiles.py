@@ -4,6 +4,8 @@ import sys
 
 import mockturtle
 
+import freegames.engines.tiles as tiles
+
 sys.modules['turtle'] = sys.modules['mockturtle']
 
 
@@ -14,4 +16,75 @@ def test_tiles():
         for x in range(-200, 200, 100)
         for y in range(-200, 200, 100)
     )
+    mockturtle.events.append(('click', 250, 0))
     runpy.run_module('freegames.tiles')
+
+
+def test_tiles_hint(monkeypatch, tmp_path):
+    monkeypatch.setenv('FREEGAMES_CACHE', str(tmp_path))
+    monkeypatch.delitem(tiles.PATTERNS, 4)
+    board = tiles.solved(4)
+    board[10], board[11], board[15] = None, 11, 12
+    monkeypatch.setattr(tiles, 'scramble', lambda size: list(board))
+    mockturtle.events[:] = [('key h',)]
+    game = runpy.run_module('freegames.tiles')
+    assert game['tiles'] != board
+    mockturtle.events[:] = [('key h',)] * 3
+    tiles.main(['--size', '4'])
+    assert tiles.ready(4)
+    game = runpy.run_module('freegames.tiles')
+    assert game['tiles'] == tiles.solved(4)
+
+
+class Stalled:
+    made = 0
+
+    def __init__(self, board):
+        Stalled.made += 1
+        self.calls = 0
+
+    def run(self, budget):
+        self.calls += 1
+        return None if self.calls == 1 else [15]
+
+
+def test_tiles_hint_timeout(monkeypatch, capsys):
+    monkeypatch.setattr(tiles, 'ready', lambda size: True)
+    monkeypatch.setattr(Stalled, 'run', lambda self, budget: None)
+    monkeypatch.setattr(Stalled, 'made', 0)
+    monkeypatch.setattr(tiles, 'Search', Stalled)
+    random.seed(0)
+    mockturtle.events[:] = [('key h',)] + [('timer', True)] * 250
+    game = runpy.run_module('freegames.tiles')
+    assert capsys.readouterr().out.count('No shortest solution') == 1
+    boards = [list(game['tiles'])]
+
+    for count in range(20):
+        game['hint']()
+        boards.append(list(game['tiles']))
+
+    assert all(boards[index] != boards[index + 2] for index in range(19))
+    assert Stalled.made == 1
+
+
+def test_tiles_hint_resume(monkeypatch):
+    monkeypatch.setattr(tiles, 'ready', lambda size: True)
+    monkeypatch.setattr(Stalled, 'made', 0)
+    monkeypatch.setattr(tiles, 'Search', Stalled)
+    board = tiles.solved(4)
+    board[14], board[15] = None, 15
+    monkeypatch.setattr(tiles, 'scramble', lambda size: list(board))
+    mockturtle.events[:] = [
+        ('key h',),
+        ('key h',),
+        ('click', -50, 150),
+        ('timer',),
+        ('key h',),
+        ('click', 50, 150),
+        ('key h',),
+        ('timer',),
+        ('timer',),
+    ]
+    game = runpy.run_module('freegames.tiles')
+    assert game['tiles'] == tiles.solved(4)
+    assert Stalled.made == 3
@@ -7,17 +7,19 @@ import mockturtle
 sys.modules['turtle'] = sys.modules['mockturtle']
 
 
-def test_tron_1():
+def test_tron_1(capsys):
     random.seed(0)
     mockturtle.events.clear()
     mockturtle.events += [('key a',), ('key d',), ('key a',)]
     mockturtle.events += [('timer', True)] * 600
     runpy.run_module('freegames.tron')
+    assert capsys.readouterr().out == 'Player red wins!\n'
 
 
-def test_tron_2():
+def test_tron_2(capsys):
     random.seed(0)
     mockturtle.events.clear()
     mockturtle.events += [('key j',), ('key l',), ('key j',)]
     mockturtle.events += [('timer', True)] * 600
     runpy.run_module('freegames.tron')
+    assert capsys.readouterr().out == 'Player blue wins!\n'
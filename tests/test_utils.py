@@ -1,3 +1,6 @@
+import math
+import random
+
 from pytest import raises
 
 import freegames.utils as utils
@@ -26,3 +29,49 @@ def test_not_implemented_paths():
     v = utils.vector(0, 0)
     assert not (v == 0)
     assert v != 0
+
+
+def test_spatial_hash_matches_brute_force():
+    rng = random.Random(0)
+    grid = utils.SpatialHash(10)
+    points = {}
+
+    for key in range(500):
+        x, y = rng.uniform(-200, 200), rng.uniform(-200, 200)
+        grid.insert(key, x, y)
+        points[key] = x, y
+
+    for key in range(0, 500, 3):
+        x, y = points[key]
+        x, y = x + rng.uniform(-15, 15), y + rng.uniform(-15, 15)
+        grid.move(key, x, y)
+        points[key] = x, y
+
+    for key in range(0, 500, 7):
+        grid.remove(key)
+        del points[key]
+
+    assert len(grid) == len(points)
+
+    for count in range(100):
+        x, y = rng.uniform(-200, 200), rng.uniform(-200, 200)
+        radius = rng.uniform(0, 40)
+        expected = {
+            key
+            for key, (px, py) in points.items()
+            if math.hypot(px - x, py - y) < radius
+        }
+        assert set(grid.query(x, y, radius)) == expected
+
+
+def test_spatial_hash_insert_again():
+    grid = utils.SpatialHash(10)
+    grid.insert('a', 0, 0)
+    grid.insert('a', 3, 0)
+    grid.insert('a', 50, 50)
+    assert len(grid) == 1
+    assert grid['a'] == (50, 50)
+    assert grid.query(0, 0, 10) == []
+    assert grid.query(50, 50, 10) == ['a']
+    grid.remove('a')
+    assert grid.cells == {}